@@ -4,17 +4,20 @@ import yaml
 import collections
 
 from yaml.representer import Representer
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config import ConfigType
 from homeassistant.components import frontend, websocket_api
+from homeassistant.helpers.area_registry import EVENT_AREA_REGISTRY_UPDATED
 
 from . import websocket
-from .websocket import blueprints, configuration, more_pages, configuration, sorting, devices, entities, areas, cards
+from .websocket import blueprints, configuration, more_pages, configuration, sorting, devices, entities, areas, cards, profiling
 from .const import DOMAIN, DASHBOARD_URL
 from .load_plugins import load_plugins
 from .load_dashboard import load_dashboard
 from .process_yaml import process_yaml
-from .notifications import async_setup_notifications
+from .notifications import async_setup_notifications, async_get_notification_manager
+from .utils import async_bump_config_version
+from .websocket.storage_helpers import async_setup_storage
 
 yaml.add_representer(collections.OrderedDict, Representer.represent_dict)
 
@@ -25,13 +28,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     # Initialize data store
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {
-            "notifications": {},
             "commands": {},
             "latest_version": ""
         }
 
     # --- Register all WebSocket commands ---
-    ws_modules = [blueprints, configuration, more_pages, configuration, sorting, devices, entities, areas, cards]
+    ws_modules = [blueprints, configuration, more_pages, configuration, sorting, devices, entities, areas, cards, profiling]
 
     for module in ws_modules:
         for name, func in inspect.getmembers(module, inspect.isfunction):
@@ -40,9 +42,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 #_LOGGER.warning("Registering WS command: %s", name)
                 websocket_api.async_register_command(hass, func)
 
+    # Area changes are part of the configuration payload
+    @callback
+    def _async_area_registry_updated(event):
+        async_bump_config_version(hass)
+
+    hass.bus.async_listen(EVENT_AREA_REGISTRY_UPDATED, _async_area_registry_updated)
+
     # Load plugins and notifications
     await load_plugins(hass, DOMAIN)
-    async_setup_notifications(hass)
+    await async_setup_notifications(hass)
+    await async_setup_storage(hass)
 
     return True
 
@@ -59,7 +69,7 @@ async def async_setup_entry(hass, config_entry):
             config_entry, ["sensor"]
         )
     )
-    async_setup_notifications(hass)
+    async_get_notification_manager(hass).async_configure(config_entry.options)
     return True
 
 async def async_remove_entry(hass, config_entry):
@@ -68,6 +78,8 @@ async def async_remove_entry(hass, config_entry):
 
 async def _update_listener(hass, config_entry):
     _LOGGER.info('Update_listener called')
+    async_get_notification_manager(hass).async_configure(config_entry.options)
+    async_bump_config_version(hass)
     await process_yaml(hass, config_entry)
     hass.bus.async_fire("{{ DOMAIN }}.reload")
     return True
@@ -4,7 +4,14 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import selector
-from .const import DOMAIN, DEFAULT_TITLE
+from .const import (
+    DOMAIN,
+    DEFAULT_TITLE,
+    CONF_NOTIFICATIONS_MAX_COUNT,
+    CONF_NOTIFICATIONS_READ_TTL,
+    DEFAULT_NOTIFICATIONS_MAX_COUNT,
+    DEFAULT_NOTIFICATIONS_READ_TTL,
+)
 
 HOMEPAGE_OPTIONS = {
     "sidepanel_title": DEFAULT_TITLE,
@@ -15,10 +22,18 @@ HOMEPAGE_OPTIONS = {
     "v2_mode": False,
     "disable_sensor_graph": False,
     "invert_cover": False,
+    CONF_NOTIFICATIONS_MAX_COUNT: DEFAULT_NOTIFICATIONS_MAX_COUNT,
+    CONF_NOTIFICATIONS_READ_TTL: DEFAULT_NOTIFICATIONS_READ_TTL,
     "weather_entity": "weather.thuis",
     "alarm_entity": "alarm_control_panel.home_alarm"
 }
 
+# Options that need more than a type check; anything else uses type(default)
+OPTION_VALIDATORS = {
+    CONF_NOTIFICATIONS_MAX_COUNT: vol.All(vol.Coerce(int), vol.Range(min=1)),
+    CONF_NOTIFICATIONS_READ_TTL: vol.All(vol.Coerce(int), vol.Range(min=0)),
+}
+
 def _opt(self, key):
     value = self._config_entry.options.get(key)
     return value or None
@@ -38,7 +53,7 @@ class DashboardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         for key, default in HOMEPAGE_OPTIONS.items():
             if key in ("weather_entity", "alarm_entity"):
                 continue
-            schema_dict[vol.Optional(key, default=default)] = type(default)
+            schema_dict[vol.Optional(key, default=default)] = OPTION_VALIDATORS.get(key, type(default))
 
         schema = vol.Schema(schema_dict)
 
@@ -66,7 +81,7 @@ class DashboardOptionsFlow(config_entries.OptionsFlow):
         for key, default in HOMEPAGE_OPTIONS.items():
             if key in ("weather_entity", "alarm_entity"):
                 continue
-            schema_dict[vol.Optional(key, default=self._config_entry.options.get(key, default))] = type(default)
+            schema_dict[vol.Optional(key, default=self._config_entry.options.get(key, default))] = OPTION_VALIDATORS.get(key, type(default))
 
         schema_dict[
             vol.Optional(
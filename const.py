@@ -5,6 +5,9 @@ FRONTEND_LOADED = "dwains_dashboard_frontend_loaded"
 WS_PREFIX = "dwains_dashboard/"
 RELOAD_HOME = "dwains_dashboard_homepage_card_reload"
 RELOAD_DEVICES = "dwains_dashboard_devicespage_card_reload"
+RELOAD_DASHBOARD = "dwains_dashboard_reload"
+RELOAD_MORE_PAGES = "dwains_dashboard_more_pages_reload"
+RELOAD_NAVIGATION = "dwains_dashboard_navigation_card_reload"
 
 # Frontend JS paths
 FRONTEND_URL = f"/{DOMAIN}/js"
@@ -15,16 +18,64 @@ FRONTEND_FILE = "dwains-dashboard.js"
 DEFAULT_TITLE = "Dwains Dashboard"
 DEFAULT_ICON = "mdi:alpha-d-box"
 DASHBOARD_URL = "dwains-dashboard"
+DATA_DASHBOARD = "dashboard"
 
 # Notifications
 DATA_NOTIFICATIONS = "notifications"
+NOTIFICATIONS_STORAGE_VERSION = 1
+NOTIFICATIONS_STORAGE_KEY = f"{DOMAIN}_notifications"
+NOTIFICATIONS_SAVE_DELAY = 10
+NOTIFICATIONS_CLEANUP_INTERVAL = 3600
+# Summary sensor: changes within this window are written once, with this many recent items
+NOTIFICATIONS_SENSOR_DELAY = 0.5
+NOTIFICATIONS_SENSOR_RECENT = 5
+CONF_NOTIFICATIONS_MAX_COUNT = "notifications_max_count"
+CONF_NOTIFICATIONS_READ_TTL = "notifications_read_ttl_days"
+DEFAULT_NOTIFICATIONS_MAX_COUNT = 100
+DEFAULT_NOTIFICATIONS_READ_TTL = 7
+
+# YAML storage
+DATA_YAML_WRITER = "yaml_writer"
+SORT_SAVE_DELAY = 2.0
+# A delayed write that failed is kept in memory and retried after this many seconds
+YAML_WRITE_RETRY_DELAY = 30
+
+# Entity settings in .storage
+DATA_STORAGE = "storage"
+STORAGE_SAVE_DELAY = 5
+
+# Configuration version, bumped on every change
+DATA_CONFIG_VERSION = "config_version"
+EVENT_CONFIGURATION_UPDATED = "dwains_dashboard_configuration_updated"
+
+# Section loaders run in parallel by configuration/get
+CONFIGURATION_LOAD_CONCURRENCY = 4
+
+# Configuration subscriptions
+DATA_CONFIGURATION_PUBLISHER = "configuration_publisher"
+CONFIGURATION_PUSH_DELAY = 0.25
+
+# Jinja templates (number of compiled templates kept in memory)
+TEMPLATE_CACHE_SIZE = 1000
+TEMPLATE_BYTECODE_CACHE_DIR = "dwains_dashboard_jinja"
+TEMPLATE_MEMO_SIZE = 1000
+# Slowest templates listed in the debug log after a dashboard render
+TEMPLATE_PROFILE_TOP_N = 10
+
+# Config folder watcher
+DATA_WATCHER = "watcher"
+WATCHER_DEBOUNCE = 1.0
+# Only if the inotify observer cannot start is the configs tree walked, this often (seconds)
+WATCHER_POLL_INTERVAL = 300
 
 # Attributes
 ATTR_NOTIFICATION_ID = "notification_id"
+ATTR_NOTIFICATION_IDS = "notification_ids"
 ATTR_TITLE = "title"
 ATTR_MESSAGE = "message"
 ATTR_STATUS = "status"
 ATTR_CREATED_AT = "created_at"
+ATTR_READ_AT = "read_at"
 
 # Status values
 STATUS_UNREAD = "unread"
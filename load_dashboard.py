@@ -1,6 +1,77 @@
+import os
+import time
+from pathlib import Path
+
+from homeassistant.components.lovelace.const import ConfigNotFound
 from homeassistant.components.lovelace.dashboard import LovelaceYAML
 from homeassistant.components.lovelace import _register_panel
-from .const import DOMAIN, DEFAULT_TITLE, DEFAULT_ICON, DASHBOARD_URL
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes, json_fragment
+from homeassistant.util.yaml import Secrets
+
+from .const import DOMAIN, DEFAULT_TITLE, DEFAULT_ICON, DASHBOARD_URL, DATA_DASHBOARD, EVENT_CONFIGURATION_UPDATED
+from .process_yaml import get_globals_version, render_dashboard
+
+
+class DashboardLovelaceYAML(LovelaceYAML):
+    """
+    YAML dashboard that keeps the rendered config in memory.
+
+    The cached config is served as is until a config file, more page or
+    option changes, or the template globals (_global, _dd_more_pages) are
+    swapped. It is then re-rendered incrementally: only subtrees
+    depending on changed files are rendered again, the rest comes from the
+    load_yamll memo. A forced load (refresh button) re-validates the
+    included files, folders and secrets.yaml by mtime the same way. A root
+    file that fails to load raises and is not cached.
+    """
+
+    def __init__(self, hass, url_path, config):
+        super().__init__(hass, url_path, config)
+        self._dirty = True
+        self._changed_files: set[str] = set()
+        self._globals_version: int | None = None
+
+    @callback
+    def async_invalidate(self, changed_files=None):
+        """Re-render on the next request; `changed_files` narrows what is rendered again."""
+        if changed_files:
+            self._changed_files.update(changed_files)
+        self._dirty = True
+
+    def _load_config(self, force):
+        globals_version = get_globals_version()
+        if (
+            not force and not self._dirty and self._cache is not None
+            and self._globals_version == globals_version
+        ):
+            config, _last_update, json = self._cache
+            return False, config, json
+
+        if not os.path.exists(self.path):
+            raise ConfigNotFound
+
+        self._dirty = False
+        self._globals_version = globals_version
+        changed, self._changed_files = self._changed_files, set()
+        try:
+            config = render_dashboard(self.path, Secrets(Path(self.hass.config.config_dir)), changed=changed)
+        except HomeAssistantError:
+            # Retry on the next request instead of serving an empty dashboard
+            self._dirty = True
+            self._changed_files |= changed
+            raise
+
+        # Nothing the dashboard depends on changed: the memo returned the same tree
+        if self._cache is not None and config is self._cache[0]:
+            return False, config, self._cache[2]
+
+        is_updated = self._cache is not None
+        json = json_fragment(json_bytes(config))
+        self._cache = (config, time.time(), json)
+        return is_updated, config, json
+
 
 def load_dashboard(hass, config_entry):
     """Register Dashboard Lovelace panel (YAML mode)."""
@@ -18,7 +89,16 @@ def load_dashboard(hass, config_entry):
         "require_admin": False,
     }
 
-    hass.data["lovelace"].dashboards[DASHBOARD_URL] = LovelaceYAML(
-        hass, DASHBOARD_URL, dashboard_config
-    )
-    _register_panel(hass, DASHBOARD_URL, "yaml", dashboard_config, False)
\ No newline at end of file
+    dashboard = DashboardLovelaceYAML(hass, DASHBOARD_URL, dashboard_config)
+    hass.data["lovelace"].dashboards[DASHBOARD_URL] = dashboard
+    _register_panel(hass, DASHBOARD_URL, "yaml", dashboard_config, False)
+
+    # Config files, more pages and options all bump the configuration version
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_DASHBOARD not in domain_data:
+        @callback
+        def _async_configuration_updated(event):
+            hass.data[DOMAIN][DATA_DASHBOARD].async_invalidate()
+
+        hass.bus.async_listen(EVENT_CONFIGURATION_UPDATED, _async_configuration_updated)
+    domain_data[DATA_DASHBOARD] = dashboard
@@ -5,12 +5,19 @@ Dashboard Notifications Backend with Sensor
 from __future__ import annotations
 
 import logging
+from bisect import bisect_left, insort
 from collections import OrderedDict
-from typing import Any
+from datetime import datetime, timedelta
+from itertools import count, islice
+from typing import Any, Callable, Mapping
 import re
 
-from homeassistant.core import HomeAssistant, callback
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
 from homeassistant.components import websocket_api
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.entity import async_generate_entity_id
@@ -18,11 +25,23 @@ from homeassistant.helpers.entity import async_generate_entity_id
 from .const import (
     DOMAIN,
     DATA_NOTIFICATIONS,
+    NOTIFICATIONS_STORAGE_VERSION,
+    NOTIFICATIONS_STORAGE_KEY,
+    NOTIFICATIONS_SAVE_DELAY,
+    NOTIFICATIONS_CLEANUP_INTERVAL,
+    NOTIFICATIONS_SENSOR_DELAY,
+    NOTIFICATIONS_SENSOR_RECENT,
+    CONF_NOTIFICATIONS_MAX_COUNT,
+    CONF_NOTIFICATIONS_READ_TTL,
+    DEFAULT_NOTIFICATIONS_MAX_COUNT,
+    DEFAULT_NOTIFICATIONS_READ_TTL,
     ATTR_CREATED_AT,
     ATTR_MESSAGE,
     ATTR_TITLE,
     ATTR_NOTIFICATION_ID,
+    ATTR_NOTIFICATION_IDS,
     ATTR_STATUS,
+    ATTR_READ_AT,
     STATUS_UNREAD,
     STATUS_READ,
     EVENT_NOTIFICATIONS_UPDATED,
@@ -30,6 +49,24 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+CREATE_BATCH_SCHEMA = vol.Schema({
+    vol.Required("notifications"): vol.All(cv.ensure_list, [vol.Schema({
+        vol.Required(ATTR_MESSAGE): cv.template,
+        vol.Optional(ATTR_TITLE): cv.template,
+        vol.Optional(ATTR_NOTIFICATION_ID): cv.string,
+    })]),
+})
+NOTIFICATION_IDS_SCHEMA = vol.Schema({
+    vol.Required(ATTR_NOTIFICATION_IDS): vol.All(cv.ensure_list, [cv.string]),
+})
+
+QUERY_SCHEMA = {
+    vol.Optional("status"): vol.In([STATUS_UNREAD, STATUS_READ]),
+    vol.Optional("since"): vol.All(cv.datetime, dt_util.as_utc),
+    vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    vol.Optional("cursor"): str,
+}
+
 ENTITY_ID_FORMAT = "dashboard.{}"
 DEFAULT_OBJECT_ID = "notification"
 STATE = "notifying"
@@ -44,173 +81,542 @@ def slugify(value: str) -> str:
     return value
 
 
-@callback
-def async_setup_notifications(hass: HomeAssistant):
-    """Set up Dashboard notifications backend with sensor."""
+class NotificationManager:
+    """
+    Notifications kept in memory and persisted to .storage.
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][DATA_NOTIFICATIONS] = OrderedDict()
-    notifications_dict = hass.data[DOMAIN][DATA_NOTIFICATIONS]
+    Saves are delayed so bursts of changes are written once. Read
+    notifications expire after the configured number of days, and the
+    oldest notifications (read ones first) are evicted above the maximum
+    count, so memory and the number of dashboard.* states stay bounded.
+    """
 
-    # ─── Helper: update summary sensor ─────────────────────────────
-    @callback
-    def _update_sensor():
-        hass.states.async_set(
-            "sensor.dashboard_notifications",
-            len(notifications_dict),
-            {
-                "notifications": list(notifications_dict.values())
-            }
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.notifications: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.max_count = DEFAULT_NOTIFICATIONS_MAX_COUNT
+        self.read_ttl = timedelta(days=DEFAULT_NOTIFICATIONS_READ_TTL)
+        self._configured = False
+        self._store = Store(hass, NOTIFICATIONS_STORAGE_VERSION, NOTIFICATIONS_STORAGE_KEY)
+        self._sensor_unsub: CALLBACK_TYPE | None = None
+        # Secondary indexes: (created_at timestamp, sequence, entity_id) sorted
+        # by creation, for all notifications (None) and per status
+        self._timelines: dict[str | None, list[tuple[float, int, str]]] = {
+            None: [], STATUS_UNREAD: [], STATUS_READ: [],
+        }
+        self._index_keys: dict[str, tuple[float, int, str]] = {}
+        self._sequence = count()
+        self._subscribers: set[Callable[[dict[str, Any]], None]] = set()
+
+    async def async_load(self):
+        """Restore the notifications of the previous run."""
+        data = await self._store.async_load() or {}
+        for item in data.get("notifications", []):
+            for attr in (ATTR_CREATED_AT, ATTR_READ_AT):
+                if isinstance(item.get(attr), str):
+                    item[attr] = dt_util.parse_datetime(item[attr])
+            entity_id = ENTITY_ID_FORMAT.format(slugify(item[ATTR_NOTIFICATION_ID]))
+            self._async_add(entity_id, item)
+
+        # No eviction here: the defaults may be stricter than the options of
+        # the entry, which async_configure applies later in setup
+        async_track_time_interval(
+            self.hass, self._async_cleanup, timedelta(seconds=NOTIFICATIONS_CLEANUP_INTERVAL)
         )
 
-    # ─── Service: create notification ─────────────────────────────
     @callback
-    def handle_create(call):
-        title: Template | None = call.data.get(ATTR_TITLE)
-        message: Template = call.data[ATTR_MESSAGE]
-        notification_id: str | None = call.data.get(ATTR_NOTIFICATION_ID)
+    def async_configure(self, options: Mapping[str, Any]):
+        """Apply the retention options of the config entry."""
+        self.max_count = options.get(CONF_NOTIFICATIONS_MAX_COUNT, DEFAULT_NOTIFICATIONS_MAX_COUNT)
+        self.read_ttl = timedelta(days=options.get(CONF_NOTIFICATIONS_READ_TTL, DEFAULT_NOTIFICATIONS_READ_TTL))
+        self._configured = True
+        if evicted := self._async_evict():
+            self._async_changed(deltas=[_dismissed_delta(evicted)])
 
-        # Generate ID if missing
-        if notification_id is None:
-            notification_id = str(int(dt_util.utcnow().timestamp() * 1000))
+    # ─── Persistence ─────────────────────────────────────────────
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"notifications": list(self.notifications.values())}
 
-        entity_id = ENTITY_ID_FORMAT.format(slugify(notification_id))
+    @callback
+    def _async_schedule_save(self):
+        self._store.async_delay_save(self._data_to_save, NOTIFICATIONS_SAVE_DELAY)
 
-        # Render templates
-        try:
-            if isinstance(message, Template):
-                message.hass = hass
-                message = message.async_render()
-        except Exception as err:
-            _LOGGER.error("Error rendering message: %s", err)
-            message = str(message)
+    # ─── Retention ───────────────────────────────────────────────
+    @callback
+    def _async_evict(self) -> list[str]:
+        """Drop expired read notifications and the oldest ones above max_count; return their IDs."""
+        evicted = []
+        if not self._configured:
+            return evicted
+        if self.read_ttl:
+            expires = dt_util.utcnow() - self.read_ttl
+            for _created, _sequence, entity_id in self._timelines[STATUS_READ]:
+                item = self.notifications[entity_id]
+                if (item.get(ATTR_READ_AT) or item[ATTR_CREATED_AT]) < expires:
+                    evicted.append(entity_id)
 
-        try:
-            if title is not None and isinstance(title, Template):
-                title.hass = hass
-                title = title.async_render()
-        except Exception as err:
-            _LOGGER.error("Error rendering title: %s", err)
-            title = str(title)
+        excess = len(self.notifications) - len(evicted) - self.max_count
+        if excess > 0:
+            # Oldest read first, then oldest unread
+            expired = set(evicted)
+            remaining = (
+                entity_id
+                for status in (STATUS_READ, STATUS_UNREAD)
+                for _created, _sequence, entity_id in self._timelines[status]
+                if entity_id not in expired
+            )
+            evicted.extend(islice(remaining, excess))
 
-        created_at = dt_util.utcnow()
+        evicted_ids = [self.notifications[entity_id][ATTR_NOTIFICATION_ID] for entity_id in evicted]
+        for entity_id in evicted:
+            self._async_discard(entity_id)
+        if evicted:
+            _LOGGER.debug("Evicted %s notifications", len(evicted))
+        return evicted_ids
+
+    async def _async_cleanup(self, _now=None):
+        if evicted := self._async_evict():
+            self._async_changed(deltas=[_dismissed_delta(evicted)])
+
+    # ─── Indexed storage ─────────────────────────────────────────
+    @callback
+    def _async_add(self, entity_id: str, item: dict[str, Any]):
+        """Store a notification as the newest one, with its state and index entries."""
+        if entity_id in self.notifications:
+            # Overwritten notifications move to the newest position
+            self._async_discard(entity_id, remove_state=False)
+        self.notifications[entity_id] = item
+        key = (item[ATTR_CREATED_AT].timestamp(), next(self._sequence), entity_id)
+        self._index_keys[entity_id] = key
+        insort(self._timelines[None], key)
+        insort(self._timelines[item[ATTR_STATUS]], key)
+        self._async_set_state(entity_id, item)
+
+    @callback
+    def _async_discard(self, entity_id: str, remove_state: bool = True):
+        item = self.notifications.pop(entity_id)
+        key = self._index_keys.pop(entity_id)
+        for timeline in (self._timelines[None], self._timelines[item[ATTR_STATUS]]):
+            del timeline[bisect_left(timeline, key)]
+        if remove_state:
+            self.hass.states.async_remove(entity_id)
 
-        # Overwrite or create
-        hass.states.async_set(
+    @callback
+    def _async_set_status(self, entity_id: str, status: str):
+        item = self.notifications[entity_id]
+        if item[ATTR_STATUS] != status:
+            key = self._index_keys[entity_id]
+            timeline = self._timelines[item[ATTR_STATUS]]
+            del timeline[bisect_left(timeline, key)]
+            insort(self._timelines[status], key)
+            item[ATTR_STATUS] = status
+
+    @property
+    def unread_count(self) -> int:
+        return len(self._timelines[STATUS_UNREAD])
+
+    def query(
+        self,
+        status: str | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None, int]:
+        """
+        Return notifications matching status and created at or after since.
+
+        Without a limit all matches are returned, oldest first. With a limit
+        a page of the newest matches older than cursor is returned, newest
+        first, together with the cursor of the next page (None on the last
+        page). The total number of matches is returned as well. Lookups are
+        bisections of the creation-ordered index of the status.
+        """
+        timeline = self._timelines[status]
+        start = bisect_left(timeline, (since.timestamp(),)) if since is not None else 0
+        end = len(timeline)
+        if cursor is not None:
+            end = max(start, bisect_left(timeline, _decode_cursor(cursor)))
+
+        if limit is None:
+            keys = timeline[start:end]
+            next_cursor = None
+        else:
+            page_start = max(start, end - limit)
+            keys = timeline[page_start:end][::-1]
+            next_cursor = _encode_cursor(timeline[page_start]) if page_start > start else None
+        return [self._as_result(self.notifications[key[2]]) for key in keys], next_cursor, len(timeline) - start
+
+    # ─── Changes ─────────────────────────────────────────────────
+    @callback
+    def _async_set_state(self, entity_id: str, item: dict[str, Any]):
+        self.hass.states.async_set(
             entity_id,
             STATE,
             {
+                ATTR_NOTIFICATION_ID: item[ATTR_NOTIFICATION_ID],
+                ATTR_MESSAGE: item[ATTR_MESSAGE],
+                ATTR_TITLE: item[ATTR_TITLE],
+                ATTR_STATUS: item[ATTR_STATUS],
+                ATTR_CREATED_AT: item[ATTR_CREATED_AT],
+            },
+        )
+
+    @callback
+    def _async_changed(self, event_data: dict[str, Any] | None = None, deltas: list[dict[str, Any]] = ()):
+        self._async_schedule_save()
+        self.hass.bus.async_fire(EVENT_NOTIFICATIONS_UPDATED, event_data)
+        self._async_schedule_sensor_update()
+        for delta in deltas:
+            delta["unread"] = self.unread_count
+            for listener in list(self._subscribers):
+                listener(delta)
+
+    @callback
+    def async_subscribe(self, listener: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """
+        Call listener with a typed delta on every change.
+
+        Deltas are {"type": "created", "notifications": [...]},
+        {"type": "dismissed", "notification_ids": [...]},
+        {"type": "read", "notification_ids": [...]} and {"type": "dismissed_all"},
+        each with the resulting "unread" count.
+        """
+        self._subscribers.add(listener)
+
+        @callback
+        def _async_unsubscribe():
+            self._subscribers.discard(listener)
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_schedule_sensor_update(self):
+        """Coalesce the changes of a burst into one sensor write."""
+        if self._sensor_unsub is None:
+            self._sensor_unsub = async_call_later(
+                self.hass, NOTIFICATIONS_SENSOR_DELAY, self._async_sensor_update_due
+            )
+
+    @callback
+    def _async_sensor_update_due(self, _now):
+        self._sensor_unsub = None
+        self.async_update_sensor()
+
+    @callback
+    def async_update_sensor(self):
+        """
+        Write the summary sensor: counts plus the most recent notifications.
+
+        The full list is served by the websocket API; keeping it out of the
+        attributes keeps recorder rows small however many notifications exist.
+        """
+        unread = self.unread_count
+        recent = list(islice(reversed(self.notifications.values()), NOTIFICATIONS_SENSOR_RECENT))
+        self.hass.states.async_set(
+            "sensor.dashboard_notifications",
+            len(self.notifications),
+            {
+                STATUS_UNREAD: unread,
+                STATUS_READ: len(self.notifications) - unread,
+                "notifications": recent[::-1],
+            }
+        )
+
+    @callback
+    def async_create(self, notification_id: str, message: str, title: str | None):
+        self.async_create_many([(notification_id, message, title)], batch=False)
+
+    @callback
+    def async_create_many(self, notifications: list[tuple[str, str, str | None]], batch: bool = True):
+        """
+        Create or overwrite notifications with one update event and one sensor write.
+
+        Batch events carry the action and the created notification_ids.
+        """
+        created_at = dt_util.utcnow()
+        created = []
+        for notification_id, message, title in notifications:
+            item = {
                 ATTR_NOTIFICATION_ID: notification_id,
                 ATTR_MESSAGE: message,
                 ATTR_TITLE: title,
                 ATTR_STATUS: STATUS_UNREAD,
                 ATTR_CREATED_AT: created_at,
-            },
-        )
-
-        notifications_dict[entity_id] = {
-            ATTR_NOTIFICATION_ID: notification_id,
-            ATTR_MESSAGE: message,
-            ATTR_TITLE: title,
-            ATTR_STATUS: STATUS_UNREAD,
-            ATTR_CREATED_AT: created_at,
-        }
+            }
+            # Overwrite or create
+            self._async_add(ENTITY_ID_FORMAT.format(slugify(notification_id)), item)
+            created.append(self._as_result(item))
 
-        hass.bus.async_fire(EVENT_NOTIFICATIONS_UPDATED)
-        _update_sensor()
+        deltas = [{"type": "created", "notifications": created}]
+        if evicted := self._async_evict():
+            deltas.append(_dismissed_delta(evicted))
+        if batch:
+            self._async_changed({
+                "action": "create",
+                "notification_ids": [notification_id for notification_id, _message, _title in notifications],
+            }, deltas)
+        else:
+            self._async_changed(deltas=deltas)
 
-    # ─── Service: dismiss notification ───────────────────────────
     @callback
-    def handle_dismiss(call):
-        notification_id = call.data.get(ATTR_NOTIFICATION_ID)
-
+    def async_dismiss(self, notification_id: str | None):
         if notification_id:
             # Dismiss a single notification
-            entity_id = ENTITY_ID_FORMAT.format(slugify(notification_id))
-            if entity_id in notifications_dict:
-                hass.states.async_remove(entity_id)
-                del notifications_dict[entity_id]
-                hass.bus.async_fire(EVENT_NOTIFICATIONS_UPDATED, {
+            if self._async_remove(notification_id):
+                self._async_changed({
                     "action": "dismiss",
                     "notification_id": notification_id,
-                })
-                _LOGGER.info("Notification dismissed: %s", notification_id)
-            else:
-                _LOGGER.warning("Notification %s not found", notification_id)
+                }, [_dismissed_delta([notification_id])])
         else:
             # Dismiss all notifications
-            for entity_id in list(notifications_dict.keys()):
-                hass.states.async_remove(entity_id)
+            for entity_id in self.notifications:
+                self.hass.states.async_remove(entity_id)
                 _LOGGER.info("Notification dismissed: %s", entity_id)
-            notifications_dict.clear()
-            hass.bus.async_fire(EVENT_NOTIFICATIONS_UPDATED, {"action": "dismiss_all"})
+            self.notifications.clear()
+            self._index_keys.clear()
+            for timeline in self._timelines.values():
+                timeline.clear()
             _LOGGER.info("All notifications dismissed")
+            self._async_changed({"action": "dismiss_all"}, [{"type": "dismissed_all"}])
 
-        # Update the summary sensor after dismissal
-        _update_sensor()
+    @callback
+    def async_dismiss_many(self, notification_ids: list[str]):
+        """Dismiss notifications with one update event and one sensor write."""
+        dismissed = [notification_id for notification_id in notification_ids if self._async_remove(notification_id)]
+        if dismissed:
+            self._async_changed({
+                "action": "dismiss",
+                "notification_ids": dismissed,
+            }, [_dismissed_delta(dismissed)])
 
-    # ─── Service: mark notification as read ──────────────────────
     @callback
-    def handle_mark_read(call):
-        notification_id = call.data.get(ATTR_NOTIFICATION_ID)
+    def _async_remove(self, notification_id: str) -> bool:
         entity_id = ENTITY_ID_FORMAT.format(slugify(notification_id))
-        notification = notifications_dict.get(entity_id)
-        if notification:
-            notification[ATTR_STATUS] = STATUS_READ
-            hass.bus.async_fire(EVENT_NOTIFICATIONS_UPDATED)
-            _update_sensor()
-            _LOGGER.info("Notification marked read: %s", notification_id)
-        else:
+        if entity_id not in self.notifications:
             _LOGGER.warning("Notification %s not found", notification_id)
+            return False
+        self._async_discard(entity_id)
+        _LOGGER.info("Notification dismissed: %s", notification_id)
+        return True
+
+    @callback
+    def async_mark_read(self, notification_id: str | None):
+        self.async_mark_read_many([notification_id], batch=False)
+
+    @callback
+    def async_mark_read_many(self, notification_ids: list[str | None], batch: bool = True):
+        """
+        Mark notifications read with one update event and one sensor write.
+
+        Batch events carry the action and the notification_ids marked read.
+        """
+        read_at = dt_util.utcnow()
+        marked = []
+        for notification_id in notification_ids:
+            entity_id = ENTITY_ID_FORMAT.format(slugify(notification_id))
+            notification = self.notifications.get(entity_id)
+            if notification:
+                self._async_set_status(entity_id, STATUS_READ)
+                notification[ATTR_READ_AT] = read_at
+                marked.append(notification_id)
+                _LOGGER.info("Notification marked read: %s", notification_id)
+            else:
+                _LOGGER.warning("Notification %s not found", notification_id)
+        if marked:
+            self._async_changed(
+                {"action": "mark_read", "notification_ids": marked} if batch else None,
+                [{"type": "read", "notification_ids": marked}],
+            )
+
+    @staticmethod
+    def _as_result(data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            ATTR_NOTIFICATION_ID: data[ATTR_NOTIFICATION_ID],
+            ATTR_MESSAGE: data[ATTR_MESSAGE],
+            ATTR_STATUS: data[ATTR_STATUS],
+            ATTR_TITLE: data.get(ATTR_TITLE),
+            ATTR_CREATED_AT: data[ATTR_CREATED_AT],
+        }
+
+    def as_list(self) -> list[dict[str, Any]]:
+        return [self._as_result(data) for data in self.notifications.values()]
+
+
+def _dismissed_delta(notification_ids: list[str]) -> dict[str, Any]:
+    return {"type": "dismissed", "notification_ids": notification_ids}
+
+def _encode_cursor(key: tuple[float, int, str]) -> str:
+    return f"{key[0]!r}:{key[1]}"
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    created, sequence = cursor.split(":")
+    return float(created), int(sequence)
+
+
+@callback
+def async_get_notification_manager(hass: HomeAssistant) -> NotificationManager | None:
+    """Return the notification manager, if notifications are set up."""
+    return hass.data.get(DOMAIN, {}).get(DATA_NOTIFICATIONS)
+
+
+def _render(hass: HomeAssistant, value, name: str):
+    try:
+        if isinstance(value, Template):
+            value.hass = hass
+            return value.async_render()
+    except Exception as err:
+        _LOGGER.error("Error rendering %s: %s", name, err)
+        return str(value)
+    return value
+
+
+def _notification_from_data(
+    hass: HomeAssistant, data: Mapping[str, Any], index: int = 0
+) -> tuple[str, str, str | None]:
+    title: Template | None = data.get(ATTR_TITLE)
+    message: Template = data[ATTR_MESSAGE]
+    notification_id: str | None = data.get(ATTR_NOTIFICATION_ID)
+
+    # Generate ID if missing; a batch is created within the same millisecond
+    if notification_id is None:
+        notification_id = str(int(dt_util.utcnow().timestamp() * 1000))
+        if index:
+            notification_id = f"{notification_id}_{index}"
+
+    return (
+        notification_id,
+        _render(hass, message, "message"),
+        _render(hass, title, "title") if title is not None else None,
+    )
+
+
+async def async_setup_notifications(hass: HomeAssistant):
+    """Set up Dashboard notifications backend with sensor."""
+
+    hass.data.setdefault(DOMAIN, {})
+    if isinstance(hass.data[DOMAIN].get(DATA_NOTIFICATIONS), NotificationManager):
+        return
+
+    manager = hass.data[DOMAIN][DATA_NOTIFICATIONS] = NotificationManager(hass)
+    await manager.async_load()
+
+    # ─── Service: create notification ─────────────────────────────
+    @callback
+    def handle_create(call):
+        manager.async_create(*_notification_from_data(hass, call.data))
+
+    # ─── Service: create several notifications at once ───────────
+    @callback
+    def handle_create_batch(call):
+        manager.async_create_many([
+            _notification_from_data(hass, data, index)
+            for index, data in enumerate(call.data["notifications"])
+        ])
+
+    # ─── Service: dismiss notification ───────────────────────────
+    @callback
+    def handle_dismiss(call):
+        manager.async_dismiss(call.data.get(ATTR_NOTIFICATION_ID))
+
+    # ─── Service: dismiss several notifications at once ──────────
+    @callback
+    def handle_dismiss_batch(call):
+        manager.async_dismiss_many(call.data[ATTR_NOTIFICATION_IDS])
+
+    # ─── Service: mark notification as read ──────────────────────
+    @callback
+    def handle_mark_read(call):
+        manager.async_mark_read(call.data.get(ATTR_NOTIFICATION_ID))
+
+    # ─── Service: mark several notifications as read at once ─────
+    @callback
+    def handle_mark_read_batch(call):
+        manager.async_mark_read_many(call.data[ATTR_NOTIFICATION_IDS])
 
     # ─── Register services ───────────────────────────────────────
     hass.services.async_register(DOMAIN, "notification_create", handle_create)
     hass.services.async_register(DOMAIN, "notification_dismiss", handle_dismiss)
     hass.services.async_register(DOMAIN, "notification_mark_read", handle_mark_read)
+    hass.services.async_register(
+        DOMAIN, "notification_create_batch", handle_create_batch, schema=CREATE_BATCH_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "notification_dismiss_batch", handle_dismiss_batch, schema=NOTIFICATION_IDS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, "notification_mark_read_batch", handle_mark_read_batch, schema=NOTIFICATION_IDS_SCHEMA
+    )
+
+    @callback
+    def _send_notifications(connection, msg):
+        """
+        Without a limit, send the list of matching notifications (oldest first).
+        With a limit, send a page of the newest ones, the cursor of the next
+        page, the number of matches and the unread count.
+        """
+        try:
+            notifications, cursor, total = manager.query(
+                msg.get("status"), msg.get("since"), msg.get("limit"), msg.get("cursor")
+            )
+        except ValueError:
+            connection.send_error(msg["id"], "invalid_format", "Invalid cursor")
+            return
+        if msg.get("limit") is None:
+            connection.send_result(msg["id"], notifications)
+            return
+        connection.send_result(msg["id"], {
+            "notifications": notifications,
+            "cursor": cursor,
+            "total": total,
+            "unread": manager.unread_count,
+        })
 
     # ─── WebSocket: get notifications ───────────────────────────
     @websocket_api.websocket_command({
-        "type": f"{DOMAIN}_notification/get"
+        "type": f"{DOMAIN}_notification/get",
+        **QUERY_SCHEMA,
     })
     @websocket_api.async_response
     async def ws_get_notifications(hass, connection, msg):
-        connection.send_result(
-            msg["id"],
-            [
-                {
-                    ATTR_NOTIFICATION_ID: data[ATTR_NOTIFICATION_ID],
-                    ATTR_MESSAGE: data[ATTR_MESSAGE],
-                    ATTR_STATUS: data[ATTR_STATUS],
-                    ATTR_TITLE: data.get(ATTR_TITLE),
-                    ATTR_CREATED_AT: data[ATTR_CREATED_AT],
-                }
-                for data in notifications_dict.values()
-            ]
-        )
+        _send_notifications(connection, msg)
 
     # ─── Backward-compatible WebSocket ─────────────────────────
     @websocket_api.websocket_command({
-        "type": f"{DOMAIN}/notifications"
+        "type": f"{DOMAIN}/notifications",
+        **QUERY_SCHEMA,
     })
     @websocket_api.async_response
     async def ws_get_notifications_old(hass, connection, msg):
-        connection.send_result(
-            msg["id"],
-            [
-                {
-                    ATTR_NOTIFICATION_ID: data[ATTR_NOTIFICATION_ID],
-                    ATTR_MESSAGE: data[ATTR_MESSAGE],
-                    ATTR_STATUS: data[ATTR_STATUS],
-                    ATTR_TITLE: data.get(ATTR_TITLE),
-                    ATTR_CREATED_AT: data[ATTR_CREATED_AT],
-                }
-                for data in notifications_dict.values()
-            ]
-        )
+        _send_notifications(connection, msg)
+
+    # ─── WebSocket: subscribe to notification changes ───────────
+    @websocket_api.websocket_command({
+        "type": f"{DOMAIN}_notification/subscribe"
+    })
+    @callback
+    def ws_subscribe_notifications(hass, connection, msg):
+        """
+        Send the current notifications once, then a typed delta per change.
+
+        The first event carries {"notifications": [...], "unread": n}; later
+        events are the deltas described in NotificationManager.async_subscribe.
+        """
+        @callback
+        def _async_send_delta(delta):
+            connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+        connection.subscriptions[msg["id"]] = manager.async_subscribe(_async_send_delta)
+        connection.send_result(msg["id"])
+        connection.send_message(websocket_api.event_message(msg["id"], {
+            "notifications": manager.as_list(),
+            "unread": manager.unread_count,
+        }))
 
     # Register WebSocket commands
     websocket_api.async_register_command(hass, ws_get_notifications)
     websocket_api.async_register_command(hass, ws_get_notifications_old)
+    websocket_api.async_register_command(hass, ws_subscribe_notifications)
 
     # ─── Initialize summary sensor ───────────────────────────────
-    _update_sensor()
+    manager.async_update_sensor()
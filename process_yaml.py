@@ -2,7 +2,13 @@ import logging
 import os
 import io
 import json
+import threading
+import time
 from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import jinja2
 import yaml
@@ -10,27 +16,141 @@ from annotatedyaml import loader
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, DASHBOARD_URL
+from .const import (
+    DOMAIN, DASHBOARD_URL, TEMPLATE_CACHE_SIZE, TEMPLATE_BYTECODE_CACHE_DIR, TEMPLATE_MEMO_SIZE,
+    TEMPLATE_PROFILE_TOP_N,
+)
+from .template_loader import IndexedBytecodeCache, ScopedTemplateLoader, TemplateIndex
+from .utils import async_setup_yaml_snapshot, invalidate_yaml_cache, load_yaml_cached, record_own_change
+from .watcher import async_get_watcher, async_setup_watcher
+from .yaml_backend import dump_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
 # --- Global dictionaries ---
 dashboard_more_pages = {}
-llgen_config = {}
+# Read-only snapshot of the merged hki-user config, replaced as a whole
+llgen_config: Mapping[str, Any] = MappingProxyType({})
+# Plain-dict copy of it for templates (filters like tojson reject mappingproxy)
+_template_globals: dict[str, Any] = {}
+
+# Bumped whenever dashboard_more_pages or llgen_config change
+globals_version = 0
+
+def _bump_globals_version():
+    global globals_version
+    globals_version += 1
+
+def get_globals_version() -> int:
+    return globals_version
 
 # --- Jinja2 Environment ---
-jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader("/"))
-jinja_env.filters["fromjson"] = lambda v: json.loads(v)
+COMPONENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _create_jinja_env(
+    cache_size: int = TEMPLATE_CACHE_SIZE, bytecode_cache=None, index: TemplateIndex | None = None
+) -> jinja2.Environment:
+    # auto_reload recompiles a cached template when its file mtime changes
+    env = jinja2.Environment(
+        loader=ScopedTemplateLoader(index if index is not None else TemplateIndex([COMPONENT_DIR])),
+        cache_size=cache_size,
+        auto_reload=True,
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters["fromjson"] = lambda v: json.loads(v)
+    return env
+
+jinja_env = _create_jinja_env()
+
+async def async_setup_template_env(hass: HomeAssistant, cache_size: int = TEMPLATE_CACHE_SIZE):
+    """
+    Scope template lookups to the config and component folders and use a
+    persistent bytecode cache so templates are not recompiled after every restart.
+    """
+    global jinja_env
+    if jinja_env.bytecode_cache is not None and getattr(jinja_env.cache, "capacity", None) == cache_size:
+        return
+
+    index = TemplateIndex([hass.config.config_dir, COMPONENT_DIR])
+    _set_dashboard_roots(
+        COMPONENT_DIR, hass.config.path("custom_components", DOMAIN),
+        hass.config.path(DASHBOARD_URL), hass.config.path("hki-user"),
+    )
+    cache_dir = hass.config.path(".storage", TEMPLATE_BYTECODE_CACHE_DIR)
+    await hass.async_add_executor_job(partial(os.makedirs, cache_dir, exist_ok=True))
+    # Only the bundled dashboard templates; user files (configs/, hki-user/)
+    # are mostly plain YAML and get indexed on their first get_template
+    count = await hass.async_add_executor_job(index.prebuild, os.path.join(COMPONENT_DIR, "lovelace"))
+    _LOGGER.debug("Indexed %s dashboard templates", count)
+    jinja_env = _create_jinja_env(cache_size, IndexedBytecodeCache(index, cache_dir), index)
+
+# --- Dashboard files ---
+# load_yamll is also Home Assistant's YAML loader; only files below these roots
+# are memoized and profiled. Core YAML (configuration, packages, secrets.yaml)
+# must get fresh objects and stays out of the dashboard profile.
+_dashboard_roots: tuple[str, ...] = (os.path.join(COMPONENT_DIR, ""),)
+
+def _set_dashboard_roots(*roots: str) -> None:
+    global _dashboard_roots
+    _dashboard_roots = tuple(os.path.join(os.path.abspath(root), "") for root in roots)
+
+def _is_dashboard_file(fname: str) -> bool:
+    return os.path.abspath(fname).startswith(_dashboard_roots)
+
+# --- Per-template profiling ---
+# fname -> counters; times are in seconds and exclude included files
+template_profile: dict[str, dict[str, float]] = {}
+_profile_lock = threading.Lock()
+
+def _profile(fname: str, output_size: int | None = None, **counters: float) -> None:
+    if not _is_dashboard_file(fname):
+        return
+    with _profile_lock:
+        entry = template_profile.get(fname)
+        if entry is None:
+            entry = template_profile[fname] = {
+                "calls": 0, "memo_hits": 0, "render_time": 0.0, "parse_time": 0.0, "output_size": 0,
+            }
+        for name, value in counters.items():
+            entry[name] += value
+        if output_size is not None:
+            entry["output_size"] = output_size
+
+def get_template_profile(sort: str = "self_time", limit: int | None = None) -> list[dict[str, Any]]:
+    """Return the profile of every loaded file, most expensive first."""
+    with _profile_lock:
+        entries = [
+            {"file": fname, **entry, "self_time": entry["render_time"] + entry["parse_time"]}
+            for fname, entry in template_profile.items()
+        ]
+    entries.sort(key=lambda entry: entry[sort], reverse=True)
+    return entries if limit is None else entries[:limit]
+
+def reset_template_profile() -> None:
+    with _profile_lock:
+        template_profile.clear()
+
+def _log_template_profile() -> None:
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    for entry in get_template_profile(limit=TEMPLATE_PROFILE_TOP_N):
+        _LOGGER.debug(
+            "%8.2f ms render %8.2f ms parse %6d calls %6d memo hits %8d chars  %s",
+            entry["render_time"] * 1000, entry["parse_time"] * 1000,
+            entry["calls"], entry["memo_hits"], entry["output_size"], entry["file"],
+        )
 
 # --- YAML Loading ---
 def render_template(fname: str, args: dict) -> io.StringIO:
     try:
+        start = time.perf_counter()
         template = jinja_env.get_template(fname)
         rendered_content = template.render({
             **args,
             "_dd_more_pages": dashboard_more_pages,
-            "_global": llgen_config
+            "_global": _current_globals()
         })
+        _profile(fname, output_size=len(rendered_content), render_time=time.perf_counter() - start)
         stream = io.StringIO(rendered_content)
         stream.name = fname
         return stream
@@ -38,28 +158,213 @@ def render_template(fname: str, args: dict) -> io.StringIO:
         _LOGGER.error("Failed to render template %s: %s", fname, e)
         raise HomeAssistantError(e)
 
+def _parse_stream(stream: io.StringIO, secrets=None):
+    """Parse with the libyaml-backed loader, falling back to the pure-Python one."""
+    if loader.HAS_C_LOADER:
+        try:
+            return loader.yaml.load(stream, Loader=lambda s: loader.FastSafeLoader(s, secrets))
+        except yaml.YAMLError:
+            # e.g. redefined anchors, which only the patched Python composer accepts
+            stream.seek(0)
+    return loader.yaml.load(stream, Loader=lambda s: loader.PythonSafeLoader(s, secrets))
+
+# --- Rendered output memo ---
+# (fname, mtime_ns, args, globals_version, globals) -> (dependencies, parsed result),
+# least recently used first. Dependencies are the (path, mtime_ns) of included
+# files, included directories and secrets.yaml files; mtime None = missing.
+# Results are shared between callers: read-only.
+_memo: OrderedDict[tuple, tuple[tuple[tuple[str, int | None], ...], Any]] = OrderedDict()
+_memo_lock = threading.Lock()
+_memo_state = threading.local()
+template_memo_stats = {"hits": 0, "misses": 0}
+def _file_mtime(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _is_memoized(fname: str) -> bool:
+    # Secrets deletes keys from the secrets.yaml it loads, so never share those
+    return _is_dashboard_file(fname) and os.path.basename(fname) != loader.SECRET_YAML
+
+def _current_globals() -> dict[str, Any]:
+    """`_global` for templates: the hki-user config merged so far while it loads."""
+    override = getattr(_memo_state, "globals", None)
+    return _template_globals if override is None else override
+
+def _memo_key(fname: str, mtime: int, args: dict) -> tuple | None:
+    try:
+        args_key = json.dumps(args, sort_keys=True, default=str)
+        override = getattr(_memo_state, "globals", None)
+        globals_key = None if override is None else json.dumps(override, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return (fname, mtime, args_key, globals_version, globals_key)
+
+def _secret_dependencies(fname: str, secrets) -> tuple[tuple[str, int | None], ...]:
+    """The secrets.yaml files `!secret` in fname can read (see Secrets.get), with their mtimes."""
+    dependencies = []
+    secret_dir = Path(fname).parent
+    while secret_dir.is_relative_to(secrets.config_dir):
+        secret_path = str(secret_dir / loader.SECRET_YAML)
+        dependencies.append((secret_path, _file_mtime(secret_path)))
+        if secret_dir == secret_dir.parent:
+            break
+        secret_dir = secret_dir.parent
+    return tuple(dependencies)
+
+def _record_dependencies(dependencies) -> None:
+    """Add files to the dependencies of the file currently being loaded, if any."""
+    stack = getattr(_memo_state, "stack", None)
+    if stack:
+        stack[-1][1].update(dependencies)
+
+# --- Include dependency graph ---
+# file -> {directly included file -> JSON of the args it was included with}
+include_graph: dict[str, dict[str, set[str]]] = {}
+
+def _record_include(fname: str, args_key: str) -> None:
+    stack = getattr(_memo_state, "stack", None)
+    if stack:
+        with _memo_lock:
+            include_graph.setdefault(stack[-1][0], {}).setdefault(fname, set()).add(args_key)
+
+def files_including(changed) -> set[str]:
+    """Return the changed files plus every file that includes one of them, directly or not."""
+    with _memo_lock:
+        included_by: dict[str, set[str]] = {}
+        for parent, children in include_graph.items():
+            for child in children:
+                included_by.setdefault(child, set()).add(parent)
+
+    affected = set()
+    todo = [os.path.abspath(path) for path in changed]
+    while todo:
+        path = todo.pop()
+        if path not in affected:
+            affected.add(path)
+            todo.extend(included_by.get(path, ()))
+    return affected
+
+def invalidate_includes(changed) -> set[str]:
+    """
+    Forget memoized results of changed files and of everything including them.
+
+    Subtrees that do not depend on a changed file keep their memo entries,
+    so the next load of a root file only re-renders the affected branches.
+    Returns the affected files.
+    """
+    affected = files_including(changed)
+    with _memo_lock:
+        for key in [key for key in _memo if key[0] in affected]:
+            del _memo[key]
+    return affected
+
+def render_dashboard(root: str, secrets=None, changed=None):
+    """
+    Load a dashboard YAML tree.
+
+    With `changed` files, their subtrees are re-rendered and spliced into
+    the otherwise memoized tree instead of rendering everything again.
+    Raises HomeAssistantError if the root file cannot be loaded.
+    """
+    if changed:
+        affected = invalidate_includes(changed)
+        _LOGGER.debug("Re-rendering %s of %s dashboard files", len(affected), len(include_graph))
+    config = _load_memoized(root, secrets)
+    _log_template_profile()
+    # Included files fall back to empty; a broken root must not become an empty dashboard
+    if config is None:
+        raise HomeAssistantError(f"Failed to load dashboard {root}")
+    return config
+
 def load_yamll(fname: str, secrets=None, args: dict = {}) -> OrderedDict:
-    if not os.path.exists(fname):
-        _LOGGER.debug("YAML file not found, skipping: %s", fname)
-        return OrderedDict()
+    result = _load_memoized(fname, secrets, args)
+    return OrderedDict() if result is None else result
 
+def _load_memoized(fname: str, secrets=None, args: dict = {}):
+    """load_yamll, but None if the file is missing or failed to load."""
+    mtime = _file_mtime(fname)
+    if mtime is None:
+        _LOGGER.debug("YAML file not found, skipping: %s", fname)
+        return None
+
+    _profile(fname, calls=1)
+
+    # Reuse the result of an identical earlier load if no included file changed
+    key = _memo_key(fname, mtime, args) if _is_memoized(fname) else None
+    _record_include(fname, key[2] if key is not None else "")
+    if key is not None:
+        with _memo_lock:
+            entry = _memo.get(key)
+            if entry is not None:
+                _memo.move_to_end(key)
+        if entry is not None and all(_file_mtime(path) == dep_mtime for path, dep_mtime in entry[0]):
+            with _memo_lock:
+                template_memo_stats["hits"] += 1
+            _profile(fname, memo_hits=1)
+            _record_dependencies(entry[0] + ((fname, mtime),))
+            return entry[1]
+        with _memo_lock:
+            template_memo_stats["misses"] += 1
+
+    if not hasattr(_memo_state, "stack"):
+        _memo_state.stack = []
+        _memo_state.include_time = []
+    dependencies: set[tuple[str, int | None]] = set()
+    _memo_state.stack.append((fname, dependencies))
+    _memo_state.include_time.append(0.0)
+    start = time.perf_counter()
+    try:
+        result = _load_yamll(fname, secrets, args)
+    finally:
+        _memo_state.stack.pop()
+        _memo_state.include_time.pop()
+        # Charge our time to the parent's includes so its parse time stays exclusive
+        if _memo_state.include_time:
+            _memo_state.include_time[-1] += time.perf_counter() - start
+
+    if key is not None and secrets is not None:
+        # Secrets caches each secrets.yaml after its first !secret, so only the
+        # first file reading it would record it; every file depends on them
+        dependencies.update(_secret_dependencies(fname, secrets))
+    dependencies = tuple(sorted(dependencies, key=lambda dep: dep[0]))
+    if key is not None and result is not None:
+        with _memo_lock:
+            _memo[key] = (dependencies, result)
+            while len(_memo) > TEMPLATE_MEMO_SIZE:
+                _memo.popitem(last=False)
+    _record_dependencies(dependencies + ((fname, mtime),))
+    return result
+
+def _load_yamll(fname: str, secrets=None, args: dict = {}):
+    """Render (if marked as template) and parse a file; None on errors."""
     try:
         with open(fname, "r", encoding="utf-8") as f:
-            first_line = f.readline().lower()
-            process_template = first_line.startswith((
-                "# dwains_dashboard", "# dwains_theme", "# lovelace_gen", "#dwains_dashboard"
-            ))
+            content = f.read()
+        first_line = content.split("\n", 1)[0].lower()
+        process_template = first_line.startswith((
+            "# dwains_dashboard", "# dwains_theme", "# lovelace_gen", "#dwains_dashboard"
+        ))
 
         if process_template:
             stream = render_template(fname, args)
-            return loader.yaml.load(stream, Loader=lambda s: loader.PythonSafeLoader(s, secrets)) or OrderedDict()
         else:
-            with open(fname, "r", encoding="utf-8") as f:
-                return loader.yaml.load(f, Loader=lambda s: loader.PythonSafeLoader(s, secrets)) or OrderedDict()
+            stream = io.StringIO(content)
+            stream.name = fname
+            _profile(fname, output_size=len(content))
+
+        # !include constructors load other files while parsing; leave their time out
+        include_time = _memo_state.include_time[-1]
+        start = time.perf_counter()
+        result = _parse_stream(stream, secrets) or OrderedDict()
+        parse_time = time.perf_counter() - start - (_memo_state.include_time[-1] - include_time)
+        _profile(fname, parse_time=parse_time)
+        return result
 
     except Exception as e:
         _LOGGER.error("Error loading YAML %s: %s", fname, e)
-        return OrderedDict()
+        return None
 
 # --- !include support ---
 def _include_yaml(loader_instance, node):
@@ -81,10 +386,33 @@ def _include_yaml(loader_instance, node):
         _LOGGER.error("Failed to include YAML file %s: %s", fname, exc)
         return OrderedDict()
 
-loader.load_yaml = load_yamll
-loader.PythonSafeLoader.add_constructor("!include", _include_yaml)
+def _track_include_dir(constructor):
+    """
+    Wrap an !include_dir_* constructor to record the included directories
+    as dependencies, so adding or removing a file there invalidates the memo.
+    """
+    def include_dir(loader_instance, node):
+        if isinstance(node.value, str):
+            loc = os.path.join(os.path.dirname(loader_instance.get_name), node.value)
+            dependencies = []
+            for root, dirs, _files in os.walk(loc):
+                dirs[:] = [d for d in dirs if loader._is_file_valid(d)]
+                dependencies.append((root, _file_mtime(root)))
+            _record_dependencies(dependencies or [(loc, None)])
+        return constructor(loader_instance, node)
+    return include_dir
 
-# --- YAML Composer patch ---
+loader.load_yaml = load_yamll
+loader.add_constructor("!include", _include_yaml)
+for _tag, _constructor in (
+    ("!include_dir_list", loader._include_dir_list_yaml),
+    ("!include_dir_merge_list", loader._include_dir_merge_list_yaml),
+    ("!include_dir_named", loader._include_dir_named_yaml),
+    ("!include_dir_merge_named", loader._include_dir_merge_named_yaml),
+):
+    loader.add_constructor(_tag, _track_include_dir(_constructor))
+
+# --- YAML Composer patch (pure-Python composer only, libyaml has its own) ---
 def compose_node(self, parent, index):
     if self.check_event(yaml.events.AliasEvent):
         event = self.get_event()
@@ -110,60 +438,144 @@ def compose_node(self, parent, index):
 yaml.composer.Composer.compose_node = compose_node
 
 # --- Page scanning helpers ---
-async def _ensure_page_config(hass: HomeAssistant, more_pages_path: str, subdir: str):
+# folder -> {name, icon, show_in_navbar, path, mtime, config}; replaced as a whole
+more_pages_index: dict[str, dict[str, Any]] = {}
+
+def _more_pages_path(hass: HomeAssistant) -> str:
+    return hass.config.path(f"{DASHBOARD_URL}/configs/more_pages")
+
+def _write_default_config(path: str, subdir: str):
+    config = OrderedDict(name=subdir, icon="mdi:puzzle")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(dump_yaml(config))
+    invalidate_yaml_cache(path)
+    record_own_change(path)
+    return config
+
+def _read_more_page(more_pages_path: str, subdir: str) -> dict[str, Any] | None:
+    """Build the index entry of one more page, creating a default config.yaml if needed (blocking)."""
     page_yaml_path = os.path.join(more_pages_path, subdir, "page.yaml")
     config_yaml_path = os.path.join(more_pages_path, subdir, "config.yaml")
 
-    if not os.path.exists(page_yaml_path):
-        return
-
-    def write_default_config(path, subdir_name):
-        with open(path, "w", encoding="utf-8") as f:
-            config = OrderedDict(name=subdir_name, icon="mdi:puzzle")
-            yaml.safe_dump(config, f, default_flow_style=False)
-        return config
+    try:
+        page_mtime = os.stat(page_yaml_path).st_mtime
+    except OSError:
+        return None
 
-    def read_config(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+    try:
+        config = load_yaml_cached(config_yaml_path)
+        if config is None:
+            config = _write_default_config(config_yaml_path, subdir)
+        elif "name" not in config or "icon" not in config:
+            _LOGGER.warning("Invalid config.yaml in %s, recreating default", subdir)
+            config = _write_default_config(config_yaml_path, subdir)
+    except Exception as e:
+        _LOGGER.error("Failed to read config.yaml in %s: %s", subdir, e)
+        config = _write_default_config(config_yaml_path, subdir)
 
-    if not os.path.exists(config_yaml_path):
-        config = await hass.async_add_executor_job(write_default_config, config_yaml_path, subdir)
-    else:
-        try:
-            config = await hass.async_add_executor_job(read_config, config_yaml_path)
-            if "name" not in config or "icon" not in config:
-                _LOGGER.warning("Invalid config.yaml in %s, recreating default", subdir)
-                config = await hass.async_add_executor_job(write_default_config, config_yaml_path, subdir)
-        except Exception as e:
-            _LOGGER.error("Failed to read config.yaml in %s: %s", subdir, e)
-            config = await hass.async_add_executor_job(write_default_config, config_yaml_path, subdir)
-
-    dashboard_more_pages[subdir] = {
+    return {
         "name": config["name"],
         "icon": config["icon"],
+        "show_in_navbar": config.get("show_in_navbar", True),
         "path": os.path.join(DASHBOARD_URL, "configs", "more_pages", subdir, "page.yaml"),
+        "mtime": page_mtime,
+        "config": config,
     }
 
-async def _scan_more_pages(hass: HomeAssistant):
-    more_pages_path = hass.config.path(f"{DASHBOARD_URL}/configs/more_pages")
-    if not os.path.isdir(more_pages_path):
-        return
+def _build_more_pages_index(more_pages_path: str) -> dict[str, dict[str, Any]]:
+    """Scan all more pages in one pass (blocking)."""
+    try:
+        with os.scandir(more_pages_path) as it:
+            subdirs = sorted(e.name for e in it if e.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
 
-    subdirs = await hass.async_add_executor_job(os.listdir, more_pages_path)
+    index = {}
     for subdir in subdirs:
-        await _ensure_page_config(hass, more_pages_path, subdir)
+        if (entry := _read_more_page(more_pages_path, subdir)) is not None:
+            index[subdir] = entry
+    return index
+
+def _swap_more_pages_index(index: dict[str, dict[str, Any]]):
+    """Install a new index and the template view derived from it."""
+    global more_pages_index, dashboard_more_pages
+
+    more_pages_index = index
+    pages = {
+        subdir: {
+            "name": entry["name"],
+            "icon": entry["icon"],
+            "show_in_navbar": entry["show_in_navbar"],
+            "path": entry["path"],
+        }
+        for subdir, entry in index.items()
+    }
+    if pages != dashboard_more_pages:
+        dashboard_more_pages = pages
+        _bump_globals_version()
 
-# --- Main YAML processor ---
-async def process_yaml(hass: HomeAssistant, config_entry):
-    hki_path = hass.config.path("hki-user/config")
-    if os.path.exists(hki_path):
-        for fname in loader._find_files(hki_path, "*.yaml"):
+def get_more_pages_index() -> dict[str, dict[str, Any]]:
+    """Return the current more pages index (do not mutate)."""
+    return more_pages_index
+
+async def _scan_more_pages(hass: HomeAssistant):
+    index = await hass.async_add_executor_job(_build_more_pages_index, _more_pages_path(hass))
+    _swap_more_pages_index(index)
+
+async def async_refresh_more_page(hass: HomeAssistant, subdir: str):
+    """Update (or drop) a single more page instead of rescanning all of them."""
+    entry = await hass.async_add_executor_job(_read_more_page, _more_pages_path(hass), subdir)
+    index = dict(more_pages_index)
+    if entry is None:
+        index.pop(subdir, None)
+    else:
+        index[subdir] = entry
+    _swap_more_pages_index(dict(sorted(index.items())))
+
+# --- hki-user config ---
+def _build_hki_config(fnames: list[str]) -> dict[str, Any]:
+    """
+    Load the hki-user config files in order (blocking).
+
+    Each file is rendered with `_global` set to the config merged from the
+    files before it, as before, so later files can use keys of earlier ones.
+    load_yamll memoizes every file on its mtime, globals_version and that
+    merged config, so unchanged files are not rendered again.
+    """
+    merged: dict[str, Any] = {}
+    try:
+        for fname in fnames:
+            _memo_state.globals = dict(merged)
             loaded_yaml = load_yamll(fname)
             if isinstance(loaded_yaml, dict):
-                llgen_config.update(loaded_yaml)
+                merged.update(loaded_yaml)
+    finally:
+        _memo_state.globals = None
+    return merged
+
+async def _async_load_hki_config(hass: HomeAssistant):
+    """Load hki-user/config on the executor and swap in a new globals snapshot."""
+    global llgen_config, _template_globals
+
+    hki_path = hass.config.path("hki-user/config")
+    fnames = await hass.async_add_executor_job(
+        lambda: list(loader._find_files(hki_path, "*.yaml")) if os.path.isdir(hki_path) else []
+    )
+    merged = await hass.async_add_executor_job(_build_hki_config, fnames)
+
+    if merged != llgen_config:
+        llgen_config = MappingProxyType(merged)
+        _template_globals = dict(merged)
+        _bump_globals_version()
+
+# --- Main YAML processor ---
+async def process_yaml(hass: HomeAssistant, config_entry):
+    await async_setup_yaml_snapshot(hass)
+    await async_setup_template_env(hass)
 
+    await _async_load_hki_config(hass)
     await _scan_more_pages(hass)
+    await async_setup_watcher(hass)
     hass.bus.async_fire("{{ DOMAIN }}.reload")
 
     async def handle_reload(call):
@@ -173,5 +585,9 @@ async def process_yaml(hass: HomeAssistant, config_entry):
     hass.services.async_register(DOMAIN, "reload", handle_reload)
 
 async def reload_configuration(hass: HomeAssistant):
+    # An explicit reload must not wait for the next watcher poll: pick up
+    # changed files now, then rebuild the more pages index from disk
+    if (watcher := async_get_watcher(hass)) is not None:
+        await watcher.async_rescan()
     await _scan_more_pages(hass)
     hass.bus.async_fire("{{ DOMAIN }}.reload")
@@ -0,0 +1,125 @@
+"""
+Jinja template loader for Dashboard.
+
+Templates are looked up by absolute path, but only below a fixed set of
+roots (the Home Assistant config folder and this component). Sources are
+kept in a path index that is refreshed by mtime, so `get_template` and
+the auto_reload up-to-date checks cost one stat per file. Files enter the
+index on their first lookup, or up front through `prebuild`. The bytecode
+cache takes its source checksums from the same index instead of hashing
+every source it is asked about.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from hashlib import sha1
+from typing import Callable, Iterable
+
+import jinja2
+
+TEMPLATE_EXTENSIONS = (".yaml", ".yml", ".jinja", ".j2")
+
+
+class TemplateIndex:
+    """Path -> (mtime_ns, source, checksum) for the templates below the allowed roots."""
+
+    def __init__(self, roots: Iterable[str]):
+        self.roots = tuple(os.path.join(os.path.normpath(root), "") for root in roots)
+        self._entries: dict[str, tuple[int, str, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resolve(self, name: str) -> str | None:
+        """Absolute path of a template name, or None if it is outside the roots."""
+        path = os.path.normpath(os.path.join(os.sep, name))
+        if path.startswith(self.roots):
+            return path
+        return None
+
+    def prebuild(self, *directories: str) -> int:
+        """Index every template below the given directories (blocking)."""
+        count = 0
+        for directory in directories:
+            for root, dirs, fnames in os.walk(directory):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                for fname in fnames:
+                    if fname.endswith(TEMPLATE_EXTENSIONS) and self.get(os.path.join(root, fname)):
+                        count += 1
+        return count
+
+    def get(self, path: str) -> tuple[int, str] | None:
+        """Return (mtime_ns, source) of a file, re-reading it only when its mtime changed."""
+        path = self.resolve(path)
+        if path is None:
+            return None
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return mtime, entry[1]
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+        with self._lock:
+            self._entries[path] = (mtime, source, None)
+        return mtime, source
+
+    def is_current(self, path: str, mtime: int) -> bool:
+        try:
+            return os.stat(path).st_mtime_ns == mtime
+        except OSError:
+            return False
+
+    def checksum(self, path: str, source: str) -> str:
+        """SHA1 of an indexed source, computed once per version of the file."""
+        entry = self._entries.get(path)
+        if entry is None or entry[1] != source:
+            return sha1(source.encode("utf-8")).hexdigest()
+        if entry[2] is None:
+            with self._lock:
+                entry = self._entries[path] = (entry[0], entry[1], sha1(source.encode("utf-8")).hexdigest())
+        return entry[2]
+
+
+class ScopedTemplateLoader(jinja2.BaseLoader):
+    """Load templates by absolute path from a TemplateIndex, rejecting paths outside its roots."""
+
+    def __init__(self, index: TemplateIndex):
+        self.index = index
+
+    def get_source(
+        self, environment: jinja2.Environment, template: str
+    ) -> tuple[str, str, Callable[[], bool]]:
+        path = self.index.resolve(template)
+        entry = self.index.get(path) if path is not None else None
+        if entry is None:
+            raise jinja2.TemplateNotFound(template)
+        mtime, source = entry
+        return source, path, lambda: self.index.is_current(path, mtime)
+
+
+class IndexedBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Bytecode cache that reuses the source checksums kept in the template index."""
+
+    def __init__(self, index: TemplateIndex, directory: str):
+        super().__init__(directory)
+        self.index = index
+
+    def get_bucket(self, environment, name, filename, source):
+        key = self.get_cache_key(name, filename)
+        checksum = self.index.checksum(filename, source) if filename else self.get_source_checksum(source)
+        bucket = jinja2.bccache.Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
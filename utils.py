@@ -1,43 +1,415 @@
 # utils.py
 from collections import OrderedDict
+import asyncio
+import copy
+import logging
 import os
-import yaml
+import pickle
+import tempfile
+import threading
+import time
+import uuid
+import weakref
 import shutil
 from datetime import datetime
-from homeassistant.core import HomeAssistant
-from .const import DASHBOARD_URL
+from functools import partial
+from typing import Any
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.file import write_utf8_file_atomic
+from .const import (
+    DOMAIN, DASHBOARD_URL, DATA_YAML_WRITER, DATA_CONFIG_VERSION, EVENT_CONFIGURATION_UPDATED,
+    YAML_WRITE_RETRY_DELAY,
+)
+from .yaml_backend import dump_yaml, load_yaml_file
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parsed YAML cache: path -> ((mtime_ns, size, inode), data), least recently used first
+YAML_CACHE_MAX_ENTRIES = 1024
+_yaml_cache: OrderedDict[str, tuple[tuple[int, int, int], Any]] = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+# Versions from before a restart must never match the current ones
+_CONFIG_VERSION_PREFIX = uuid.uuid4().hex[:8]
 
 def config_path(hass: HomeAssistant, *subpaths) -> str:
     """Return full path inside dashboard/configs"""
     return hass.config.path(f"{DASHBOARD_URL}/configs", *subpaths)
 
+@callback
+def async_get_config_version(hass: HomeAssistant) -> str:
+    """Return the current dashboard configuration version."""
+    counter = hass.data.get(DOMAIN, {}).get(DATA_CONFIG_VERSION, 0)
+    return f"{_CONFIG_VERSION_PREFIX}-{counter}"
+
+@callback
+def async_bump_config_version(hass: HomeAssistant) -> str:
+    """Mark the dashboard configuration as changed and return the new version."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[DATA_CONFIG_VERSION] = domain_data.get(DATA_CONFIG_VERSION, 0) + 1
+    version = async_get_config_version(hass)
+    hass.bus.async_fire(EVENT_CONFIGURATION_UPDATED, {"version": version})
+    return version
+
+def load_yaml_cached(filepath):
+    """
+    Load a YAML file through the parsed-config cache (blocking).
+
+    Entries are validated against (mtime_ns, size, inode), so files edited
+    outside the dashboard are picked up on the next read. Returns a private
+    copy the caller may mutate, or None if the file is missing or empty.
+    """
+    try:
+        st = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if st.st_size == 0:
+        return None
+
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(filepath)
+        if cached is not None and cached[0] == signature:
+            _yaml_cache.move_to_end(filepath)
+            return copy.deepcopy(cached[1])
+
+    data = load_yaml_file(filepath)
+
+    with _yaml_cache_lock:
+        _yaml_cache[filepath] = (signature, data)
+        _yaml_cache.move_to_end(filepath)
+        while len(_yaml_cache) > YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+def invalidate_yaml_cache(path):
+    """Drop cached entries for a file, or for everything below a folder."""
+    prefix = os.path.join(path, "")
+    with _yaml_cache_lock:
+        for cached_path in [p for p in _yaml_cache if p == path or p.startswith(prefix)]:
+            del _yaml_cache[cached_path]
+
+# Compiled snapshot of the YAML cache, kept in .storage between restarts
+YAML_SNAPSHOT_VERSION = 1
+DATA_YAML_SNAPSHOT = "yaml_snapshot"
+
+def _yaml_snapshot_path(hass: HomeAssistant) -> str:
+    return hass.config.path(".storage", f"{DOMAIN}.yaml_snapshot")
+
+def load_yaml_snapshot(snapshot_path) -> int:
+    """
+    Seed the YAML cache from a snapshot file (blocking).
+
+    The snapshot stores a manifest of (path, (mtime_ns, size, inode)) with
+    the parsed data; only entries whose file is unchanged are restored, so
+    changed files are reparsed on first read. Returns the restored count.
+    """
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception as err:
+        _LOGGER.warning("Ignoring unreadable YAML snapshot %s: %s", snapshot_path, err)
+        return 0
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != YAML_SNAPSHOT_VERSION:
+        return 0
+
+    restored = 0
+    for path, signature, data in snapshot["entries"]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if (st.st_mtime_ns, st.st_size, st.st_ino) != signature:
+            continue
+        with _yaml_cache_lock:
+            if path not in _yaml_cache and len(_yaml_cache) < YAML_CACHE_MAX_ENTRIES:
+                _yaml_cache[path] = (signature, data)
+                restored += 1
+    return restored
+
+def save_yaml_snapshot(snapshot_path):
+    """Write the current YAML cache to a snapshot file (blocking)."""
+    with _yaml_cache_lock:
+        entries = [(path, signature, data) for path, (signature, data) in _yaml_cache.items()]
+
+    directory = os.path.dirname(snapshot_path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".dwains_snapshot_")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"version": YAML_SNAPSHOT_VERSION, "entries": entries}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+async def async_setup_yaml_snapshot(hass: HomeAssistant):
+    """Restore the YAML cache snapshot once and save it again when Home Assistant stops."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(DATA_YAML_SNAPSHOT):
+        return
+    domain_data[DATA_YAML_SNAPSHOT] = True
+
+    snapshot_path = _yaml_snapshot_path(hass)
+    restored = await hass.async_add_executor_job(load_yaml_snapshot, snapshot_path)
+    _LOGGER.debug("Restored %s parsed YAML files from snapshot", restored)
+
+    async def _async_save_snapshot(_event):
+        # Write pending documents first so the snapshot matches the disk
+        await async_get_yaml_writer(hass).async_flush()
+        try:
+            await hass.async_add_executor_job(save_yaml_snapshot, snapshot_path)
+        except Exception as err:
+            _LOGGER.warning("Failed to save YAML snapshot: %s", err)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_snapshot)
+
+# Changes made by the dashboard itself: path -> (signature or None if removed, time)
+OWN_CHANGE_TTL = 30
+_own_changes: dict[str, tuple[tuple[int, int, int] | None, float]] = {}
+_own_changes_lock = threading.Lock()
+
+def record_own_change(path):
+    """Remember that the dashboard just wrote or removed path (blocking)."""
+    try:
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        signature = None
+    now = time.monotonic()
+    with _own_changes_lock:
+        for old_path in [p for p, (_, at) in _own_changes.items() if now - at > OWN_CHANGE_TTL]:
+            del _own_changes[old_path]
+        _own_changes[path] = (signature, now)
+
+def is_own_change(path, signature) -> bool:
+    """Return True if path is in the state the dashboard itself left it in."""
+    now = time.monotonic()
+    with _own_changes_lock:
+        for own_path, (own_signature, at) in _own_changes.items():
+            if now - at > OWN_CHANGE_TTL:
+                continue
+            if own_path == path and own_signature == signature:
+                return True
+            # Files below a folder the dashboard removed
+            if own_signature is None and signature is None and path.startswith(os.path.join(own_path, "")):
+                return True
+    return False
+
+def write_yaml_atomic(filepath, data):
+    """Dump YAML to a temp file next to filepath and rename it into place (blocking)."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    content = dump_yaml(data)
+    write_utf8_file_atomic(filepath, content, private=False)
+    invalidate_yaml_cache(filepath)
+    record_own_change(filepath)
+
+class YamlWriteBehind:
+    """
+    Write-behind layer for YAML files.
+
+    Saved documents are kept in memory until they are written; saves with a
+    delay are coalesced so a burst of updates to one file within the window
+    results in a single atomic write. Pending documents are flushed when
+    Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._pending: dict[str, Any] = {}
+        self._timers: dict[str, CALLBACK_TYPE] = {}
+        self._write_lock = asyncio.Lock()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_on_stop)
+
+    @callback
+    def get_pending(self, filepath):
+        """Return the unwritten document for filepath, if any."""
+        return self._pending.get(filepath)
+
+    @callback
+    def get_pending_below(self, path) -> dict[str, Any]:
+        """Return the unwritten documents inside folder path."""
+        prefix = os.path.join(path, "")
+        return {p: data for p, data in self._pending.items() if p.startswith(prefix)}
+
+    async def async_save(self, filepath, data, delay: float = 0):
+        """Store data for filepath; write now, or within `delay` seconds."""
+        self._pending[filepath] = data
+        async_bump_config_version(self.hass)
+        if delay <= 0:
+            await self.async_flush(filepath)
+        elif filepath not in self._timers:
+            self._timers[filepath] = async_call_later(
+                self.hass, delay, partial(self._async_timer_fired, filepath)
+            )
+
+    async def async_flush(self, filepath=None):
+        """
+        Write one pending document, or all of them.
+
+        A document stays pending until it is written, so a failed write
+        raises and keeps the data for a later retry.
+        """
+        for path in [filepath] if filepath else list(self._pending):
+            if unsub := self._timers.pop(path, None):
+                unsub()
+            if path not in self._pending:
+                continue
+
+            async with self._write_lock:
+                data = self._pending.get(path)
+                if data is None:
+                    continue
+                await self.hass.async_add_executor_job(write_yaml_atomic, path, data)
+                # Keep newer data that arrived while writing
+                if self._pending.get(path) is data:
+                    del self._pending[path]
+
+    @callback
+    def async_discard(self, path):
+        """Forget pending writes for a file or everything below a folder."""
+        prefix = os.path.join(path, "")
+        for pending_path in [p for p in self._pending if p == path or p.startswith(prefix)]:
+            if unsub := self._timers.pop(pending_path, None):
+                unsub()
+            del self._pending[pending_path]
+
+    async def _async_timer_fired(self, filepath, _now):
+        try:
+            await self.async_flush(filepath)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to write YAML %s, retrying in %s seconds: %s", filepath, YAML_WRITE_RETRY_DELAY, err
+            )
+            if filepath in self._pending and filepath not in self._timers:
+                self._timers[filepath] = async_call_later(
+                    self.hass, YAML_WRITE_RETRY_DELAY, partial(self._async_timer_fired, filepath)
+                )
+
+    async def _async_on_stop(self, _event):
+        for path in list(self._pending):
+            try:
+                await self.async_flush(path)
+            except Exception as err:
+                _LOGGER.error("Failed to write YAML %s: %s", path, err)
+
+@callback
+def async_get_yaml_writer(hass: HomeAssistant) -> YamlWriteBehind:
+    """Return the shared write-behind saver, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_YAML_WRITER not in domain_data:
+        domain_data[DATA_YAML_WRITER] = YamlWriteBehind(hass)
+    return domain_data[DATA_YAML_WRITER]
+
+async def _async_load_yaml_or_pending(hass, filepath):
+    """Return unwritten data for filepath if there is any, else read it from disk."""
+    pending = async_get_yaml_writer(hass).get_pending(filepath)
+    if pending is not None:
+        return copy.deepcopy(pending)
+    return await hass.async_add_executor_job(load_yaml_cached, filepath)
+
 async def async_load_yaml(hass, filepath, default=None):
     """Async-safe load YAML file."""
     default = default or OrderedDict()
+    data = await _async_load_yaml_or_pending(hass, filepath)
+    return data or default
 
-    if not os.path.exists(filepath) or os.stat(filepath).st_size == 0:
-        return default
+async def async_save_yaml(hass, filepath, data, delay: float = 0):
+    """
+    Async-safe save YAML file.
 
-    def _load():
-        with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or default
+    With a delay the write is deferred and merged with later saves of the
+    same file; reads through these helpers see the new data immediately.
+    """
+    await async_get_yaml_writer(hass).async_save(filepath, data, delay)
 
-    return await hass.async_add_executor_job(_load)
+# Per-file locks, dropped automatically once nobody holds or waits on them
+_yaml_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 
-async def async_save_yaml(hass, filepath, data):
-    """Async-safe save YAML file."""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    await hass.async_add_executor_job(lambda: yaml.dump(data, open(filepath, "w"), default_flow_style=False, sort_keys=False))
+@callback
+def async_get_yaml_lock(filepath) -> asyncio.Lock:
+    """Return the lock guarding read-modify-write cycles on filepath."""
+    lock = _yaml_locks.get(filepath)
+    if lock is None:
+        lock = _yaml_locks[filepath] = asyncio.Lock()
+    return lock
+
+class YamlTransaction:
+    """
+    Read-modify-write one or more YAML files as a unit.
+
+    Every file is locked for the duration of the block, loaded once on
+    entry and saved once on a clean exit. Files are locked in sorted order
+    so overlapping transactions cannot deadlock. Transactions are not
+    reentrant: do not open a second one on the same file inside the block.
+
+        async with YamlTransaction(hass, card_file, entities_file) as tx:
+            tx[card_file].update(card_data)
+            tx[entities_file].setdefault(entity_id, OrderedDict())["custom_card"] = True
+    """
+
+    def __init__(self, hass: HomeAssistant, *filepaths: str, delay: float = 0):
+        self.hass = hass
+        self._paths = sorted(set(filepaths))
+        self._delay = delay
+        self._data: dict[str, Any] = {}
+        self._locks: list[asyncio.Lock] = []
+
+    def __getitem__(self, filepath):
+        return self._data[filepath]
+
+    def __setitem__(self, filepath, data):
+        if filepath not in self._data:
+            raise KeyError(f"{filepath} is not part of this transaction")
+        self._data[filepath] = data
+
+    async def __aenter__(self):
+        try:
+            for path in self._paths:
+                lock = async_get_yaml_lock(path)
+                await lock.acquire()
+                self._locks.append(lock)
+            for path in self._paths:
+                self._data[path] = await async_load_yaml(self.hass, path)
+        except BaseException:
+            self._release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                for path in self._paths:
+                    await async_save_yaml(self.hass, path, self._data[path], self._delay)
+        finally:
+            self._release()
+
+    def _release(self):
+        while self._locks:
+            self._locks.pop().release()
+
+def _apply_yaml_updates(data, updates, key: str | None = None):
+    """Apply a dict of updates (optionally below `key`) or an update callable."""
+    if callable(updates):
+        return updates(data)
+    if updates:
+        if key:
+            data.setdefault(key, OrderedDict()).update(updates)
+        else:
+            data.update(updates)
+    return data
 
 async def async_update_yaml(hass, filepath, updates: dict, key: str | None = None):
     """Load YAML, update keys, save it."""
-    data = await async_load_yaml(hass, filepath)
-    if key:
-        data.setdefault(key, OrderedDict()).update(updates)
-    else:
-        data.update(updates)
-    await async_save_yaml(hass, filepath, data)
-    return data
+    async with YamlTransaction(hass, filepath) as tx:
+        tx[filepath] = _apply_yaml_updates(tx[filepath], updates, key)
+    return tx[filepath]
 
 async def async_remove_file_or_folder(hass, path):
     """Async-safe remove file or folder."""
@@ -49,8 +421,12 @@ async def async_remove_file_or_folder(hass, path):
             shutil.rmtree(path)
         else:
             os.remove(path)
+        record_own_change(path)
 
+    async_get_yaml_writer(hass).async_discard(path)
     await hass.async_add_executor_job(_remove)
+    invalidate_yaml_cache(path)
+    async_bump_config_version(hass)
 
 async def handle_ws_yaml_update(
     hass,
@@ -71,24 +447,35 @@ async def handle_ws_yaml_update(
     - `key`: optional, for nested structures (like entity_id or device_id).
     - `reload_events`: list of HA events to fire after saving.
     """
-    try:
-        # Load existing data or create new
-        try:
-            current_data = await async_load_yaml(hass, filepath)
-        except FileNotFoundError:
-            current_data = OrderedDict()
-
-        # Apply updates
-        if callable(updates):
-            current_data = updates(current_data)
-        elif updates:
-            if key:
-                current_data.setdefault(key, OrderedDict()).update(updates)
-            else:
-                current_data.update(updates)
+    await handle_ws_yaml_transaction(
+        hass,
+        connection,
+        msg,
+        {filepath: partial(_apply_yaml_updates, updates=updates, key=key)},
+        reload_events=reload_events,
+        success_msg=success_msg,
+    )
 
-        # Save YAML
-        await async_save_yaml(hass, filepath, current_data)
+async def handle_ws_yaml_transaction(
+    hass,
+    connection,
+    msg: dict,
+    changes: dict[str, Any],
+    reload_events: list[str] | None = None,
+    success_msg: str = "Saved successfully",
+):
+    """
+    Generic WS handler for changing several YAML files in one transaction.
+
+    - `changes`: maps file path to a dict of updates or a callable that
+      modifies the existing data, as for `handle_ws_yaml_update`.
+    - Each file is loaded and saved once, under its lock, and a single
+      result is sent back.
+    """
+    try:
+        async with YamlTransaction(hass, *changes) as tx:
+            for filepath, updates in changes.items():
+                tx[filepath] = _apply_yaml_updates(tx[filepath], updates)
 
         # Fire reload events
         if reload_events:
@@ -99,52 +486,68 @@ async def handle_ws_yaml_update(
         connection.send_result(msg["id"], {"successful": success_msg})
 
     except Exception as e:
-        _LOGGER.error("Failed to update YAML %s: %s", filepath, e)
+        _LOGGER.error("Failed to update YAML %s: %s", ", ".join(changes), e)
         connection.send_error(msg["id"], "update_failed", str(e))
 
 async def async_load_yaml_file(hass, file_path):
     """Load a YAML file safely in an executor."""
-    if not os.path.exists(file_path):
-        return OrderedDict()
-    def _load():
-        with open(file_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or OrderedDict()
-    return await hass.async_add_executor_job(_load)
+    data = await _async_load_yaml_or_pending(hass, file_path)
+    return data or OrderedDict()
 
-async def async_load_yaml_from_dir(hass, dir_path, strip_ext=False, nested=False):
+def load_yaml_dir(full_path, strip_ext=False, nested=False, pending=None, include=None):
+    """
+    Load all YAML files of a card folder in one pass (blocking).
+
+    Meant to run as a single executor job: the folder is walked with
+    os.scandir and every file is parsed through the YAML cache. `pending`
+    maps paths to unwritten documents that take precedence over the disk.
+    `include` optionally selects subfolders (nested) or files by name
+    without extension; everything else is not read at all.
+    """
+    pending = pending or {}
+
+    def _load_files(path, strip, include_file=None):
+        files = OrderedDict()
+        with os.scandir(path) as it:
+            entries = sorted(
+                (
+                    e for e in it
+                    if e.name.endswith(".yaml") and e.is_file()
+                    and (include_file is None or include_file(e.name[:-5]))
+                ),
+                key=lambda e: e.name,
+            )
+        for entry in entries:
+            if entry.path in pending:
+                content = copy.deepcopy(pending[entry.path])
+            else:
+                content = load_yaml_cached(entry.path)
+            files[entry.name[:-5] if strip else entry.name] = content or OrderedDict()
+        return files
+
+    result = OrderedDict()
+    try:
+        if nested:
+            with os.scandir(full_path) as it:
+                subdirs = sorted(
+                    (e for e in it if e.is_dir() and (include is None or include(e.name))),
+                    key=lambda e: e.name,
+                )
+            for subdir in subdirs:
+                result[subdir.name] = _load_files(subdir.path, False)
+        else:
+            result.update(_load_files(full_path, strip_ext, include))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return result
+
+async def async_load_yaml_from_dir(hass, dir_path, strip_ext=False, nested=False, include=None):
     """
     Load YAML files from a directory asynchronously.
     - nested=True: loads YAML files inside subdirectories
     - strip_ext=True: removes '.yaml' from keys
+    - include: optional predicate on subdirectory (nested) or file name
     """
-    result = OrderedDict()
     full_path = hass.config.path(dir_path)
-
-    if not os.path.isdir(full_path):
-        return result
-
-    if nested:
-        subdirs = [
-            d for d in await hass.async_add_executor_job(os.listdir, full_path)
-            if os.path.isdir(os.path.join(full_path, d))
-        ]
-        for subdir in subdirs:
-            subdir_path = os.path.join(full_path, subdir)
-            subdir_dict = OrderedDict()
-            fnames = sorted(await hass.async_add_executor_job(os.listdir, subdir_path))
-            for fname in fnames:
-                if fname.endswith(".yaml"):
-                    file_path = os.path.join(subdir_path, fname)
-                    content = await async_load_yaml_file(hass, file_path)
-                    subdir_dict[fname] = content
-            result[subdir] = subdir_dict
-    else:
-        fnames = sorted(await hass.async_add_executor_job(os.listdir, full_path))
-        for fname in fnames:
-            if fname.endswith(".yaml"):
-                file_path = os.path.join(full_path, fname)
-                content = await async_load_yaml_file(hass, file_path)
-                key = fname[:-5] if strip_ext else fname
-                result[key] = content
-
-    return result
\ No newline at end of file
+    pending = async_get_yaml_writer(hass).get_pending_below(full_path)
+    return await hass.async_add_executor_job(load_yaml_dir, full_path, strip_ext, nested, pending, include)
@@ -0,0 +1,247 @@
+"""
+Filesystem watcher for the Dashboard config folder.
+
+Keeps an index of every file below dwains-dashboard/configs and turns
+changes made outside the dashboard (hand edits over Samba, git pulls, ...)
+into targeted cache invalidation and reload events.
+
+Changes arrive through a watchdog (inotify) observer. Only if the observer
+cannot start (e.g. the inotify watch limit is reached) is the whole configs
+tree walked and stat'ed, every WATCHER_POLL_INTERVAL seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from datetime import timedelta
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    DATA_WATCHER,
+    DATA_DASHBOARD,
+    WATCHER_DEBOUNCE,
+    WATCHER_POLL_INTERVAL,
+    RELOAD_HOME,
+    RELOAD_DEVICES,
+    RELOAD_DASHBOARD,
+    RELOAD_MORE_PAGES,
+    RELOAD_NAVIGATION,
+)
+from .utils import async_bump_config_version, config_path, invalidate_yaml_cache, is_own_change
+
+_LOGGER = logging.getLogger(__name__)
+
+# Top-level config files and card folders -> events the frontend reloads on
+RELOAD_EVENTS_BY_SECTION = {
+    "entities.yaml": [RELOAD_HOME, RELOAD_DEVICES],
+    "devices.yaml": [RELOAD_DEVICES, RELOAD_NAVIGATION],
+    "areas.yaml": [RELOAD_HOME],
+    "areas": [RELOAD_HOME],
+    "entities": [RELOAD_HOME, RELOAD_DEVICES],
+    "entities_popup": [RELOAD_DASHBOARD],
+    "devices": [RELOAD_DEVICES],
+    "devices_card": [RELOAD_DEVICES],
+    "devices_popup": [RELOAD_DASHBOARD],
+}
+
+
+def _is_indexed(name: str) -> bool:
+    return name.endswith(".yaml") and not name.startswith(".")
+
+
+def _scan(path: str) -> dict[str, tuple[int, int, int]]:
+    """Return the signature of every YAML file at or below path (blocking)."""
+    files = {}
+    if os.path.isfile(path):
+        paths = [path] if _is_indexed(os.path.basename(path)) else []
+    else:
+        paths = []
+        for root, dirs, fnames in os.walk(path):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            paths.extend(os.path.join(root, f) for f in fnames if _is_indexed(f))
+    for file_path in paths:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        files[file_path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+    return files
+
+
+class ConfigWatcher:
+    """Index of the config folder, updated incrementally from change notifications."""
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.root = config_path(hass)
+        self.index: dict[str, tuple[int, int, int]] = {}
+        self._dirty: set[str] = set()
+        self._debounce_unsub: CALLBACK_TYPE | None = None
+        self._poll_unsub: CALLBACK_TYPE | None = None
+        self._observer = None
+        self._rescan_lock = asyncio.Lock()
+
+    @property
+    def more_pages(self) -> set[str]:
+        """Folder names of the more pages that have a page.yaml."""
+        pages_root = os.path.join(self.root, "more_pages", "")
+        return {
+            os.path.relpath(path, pages_root).split(os.sep)[0]
+            for path in self.index
+            if path.startswith(pages_root) and os.path.basename(path) == "page.yaml"
+        }
+
+    async def async_start(self):
+        """Build the initial index and start watching."""
+        await self.hass.async_add_executor_job(os.makedirs, self.root, 0o755, True)
+        self.index = await self.hass.async_add_executor_job(_scan, self.root)
+
+        try:
+            self._observer = await self.hass.async_add_executor_job(self._start_observer)
+            _LOGGER.debug("Watching %s with inotify", self.root)
+            return
+        except Exception as err:
+            _LOGGER.warning("Cannot watch %s, falling back to polling: %s", self.root, err)
+
+        self._poll_unsub = async_track_time_interval(
+            self.hass, self._async_poll, timedelta(seconds=WATCHER_POLL_INTERVAL)
+        )
+
+    async def async_stop(self, _event=None):
+        """Stop watching."""
+        if self._debounce_unsub:
+            self._debounce_unsub()
+            self._debounce_unsub = None
+        if self._poll_unsub:
+            self._poll_unsub()
+            self._poll_unsub = None
+        if self._observer is not None:
+            observer, self._observer = self._observer, None
+            await self.hass.async_add_executor_job(self._stop_observer, observer)
+
+    def _start_observer(self):
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type not in ("created", "deleted", "modified", "moved", "closed"):
+                    return
+                if event.is_directory and event.event_type == "modified":
+                    return
+                paths = [event.src_path, getattr(event, "dest_path", "")]
+                watcher.hass.loop.call_soon_threadsafe(watcher._async_mark_dirty, [p for p in paths if p])
+
+        observer = Observer()
+        observer.schedule(_Handler(), self.root, recursive=True)
+        observer.start()
+        return observer
+
+    @staticmethod
+    def _stop_observer(observer):
+        observer.stop()
+        observer.join()
+
+    @callback
+    def _async_mark_dirty(self, paths: list[str]):
+        """Collect changed paths; editors save in bursts, so wait for a quiet moment."""
+        self._dirty.update(paths)
+        if self._debounce_unsub:
+            self._debounce_unsub()
+        self._debounce_unsub = async_call_later(self.hass, WATCHER_DEBOUNCE, self._async_process_dirty)
+
+    async def _async_process_dirty(self, _now=None):
+        self._debounce_unsub = None
+        paths, self._dirty = self._dirty, set()
+        await self._async_rescan(paths)
+
+    async def _async_poll(self, _now=None):
+        await self._async_rescan({self.root})
+
+    async def async_rescan(self):
+        """Rescan the whole config folder now and handle what changed."""
+        await self._async_rescan({self.root})
+
+    async def _async_rescan(self, paths: set[str]):
+        async with self._rescan_lock:
+            changed = await self.hass.async_add_executor_job(self._diff_index, paths)
+            for file_path, signature in changed.items():
+                if signature is None:
+                    self.index.pop(file_path, None)
+                else:
+                    self.index[file_path] = signature
+        if changed:
+            await self._async_handle_changes(changed)
+
+    def _diff_index(self, paths: set[str]) -> dict[str, tuple[int, int, int] | None]:
+        """Rescan paths and return the files whose signature changed (blocking)."""
+        changed = {}
+        for path in paths:
+            prefix = os.path.join(path, "")
+            current = _scan(path) if os.path.exists(path) else {}
+            previous = {p: sig for p, sig in self.index.items() if p == path or p.startswith(prefix)}
+            for file_path, signature in current.items():
+                if previous.get(file_path) != signature:
+                    changed[file_path] = signature
+            for file_path in previous.keys() - current.keys():
+                changed[file_path] = None
+        return changed
+
+    async def _async_handle_changes(self, changed: dict[str, tuple[int, int, int] | None]):
+        """Invalidate caches and fire reload events for the changed sections only."""
+        from .process_yaml import async_refresh_more_page
+
+        events: set[str] = set()
+        pages: set[str] = set()
+        for file_path, signature in changed.items():
+            invalidate_yaml_cache(file_path)
+            if is_own_change(file_path, signature):
+                # The websocket command that made this change already reloaded
+                continue
+
+            parts = os.path.relpath(file_path, self.root).split(os.sep)
+            if parts[0] == "more_pages" and len(parts) > 2:
+                pages.add(parts[1])
+            elif parts[0] == "cards" and len(parts) > 2:
+                events.update(RELOAD_EVENTS_BY_SECTION.get(parts[1], [RELOAD_DASHBOARD]))
+            else:
+                events.update(RELOAD_EVENTS_BY_SECTION.get(parts[0], [RELOAD_DASHBOARD]))
+
+        # Pages include files from this folder, re-render those subtrees
+        if (dashboard := self.hass.data[DOMAIN].get(DATA_DASHBOARD)) is not None:
+            dashboard.async_invalidate(changed)
+
+        for page in pages:
+            await async_refresh_more_page(self.hass, page)
+        if pages:
+            events.update((RELOAD_MORE_PAGES, RELOAD_NAVIGATION))
+
+        if events:
+            _LOGGER.debug("Config files changed: %s", ", ".join(changed))
+            async_bump_config_version(self.hass)
+        for event in events:
+            self.hass.bus.async_fire(event)
+
+
+async def async_setup_watcher(hass: HomeAssistant) -> ConfigWatcher:
+    """Start the config folder watcher once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_WATCHER not in domain_data:
+        watcher = domain_data[DATA_WATCHER] = ConfigWatcher(hass)
+        await watcher.async_start()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, watcher.async_stop)
+    return domain_data[DATA_WATCHER]
+
+
+@callback
+def async_get_watcher(hass: HomeAssistant) -> ConfigWatcher | None:
+    """Return the running watcher, if any."""
+    return hass.data.get(DOMAIN, {}).get(DATA_WATCHER)
@@ -14,5 +14,6 @@ from .devices import *
 from .entities import *
 from .areas import *
 from .cards import *
+from .profiling import *
 
 __all__ = [name for name in globals() if name.startswith(("ws_", "websocket_"))]
\ No newline at end of file
@@ -4,20 +4,36 @@ WebSocket configuration commands for Dashboard.
 
 from __future__ import annotations
 
-import os
+import asyncio
+import copy
 from collections import OrderedDict
-from typing import Any, Mapping
+from functools import partial
+from typing import Any, Awaitable, Callable, Mapping
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
 from homeassistant.helpers import area_registry
+from homeassistant.helpers.event import async_call_later
 from homeassistant.components import websocket_api
 
-from ..const import DOMAIN, VERSION, WS_PREFIX, RELOAD_HOME, RELOAD_DEVICES
-from ..utils import config_path, async_load_yaml_file, async_load_yaml_from_dir
-from ..process_yaml import reload_configuration
-from .helpers import ws_send_success, ws_send_error, ws_safe_json_load, ws_yaml_edit_command
+from ..const import (
+    DOMAIN,
+    VERSION,
+    WS_PREFIX,
+    RELOAD_HOME,
+    RELOAD_DEVICES,
+    DATA_CONFIGURATION_PUBLISHER,
+    EVENT_CONFIGURATION_UPDATED,
+    CONFIGURATION_PUSH_DELAY,
+    CONFIGURATION_LOAD_CONCURRENCY,
+    CONF_NOTIFICATIONS_MAX_COUNT,
+    CONF_NOTIFICATIONS_READ_TTL,
+)
+from ..utils import config_path, async_get_config_version, async_load_yaml_file, async_load_yaml_from_dir
+from ..process_yaml import get_more_pages_index, reload_configuration
+from .storage_helpers import async_get_storage_manager
+from .helpers import make_json_patch, ws_send_success, ws_send_error, ws_safe_json_load, ws_yaml_edit_command
 
 # ------------------------------------------------------------------
 # Schemas
@@ -25,6 +41,14 @@ from .helpers import ws_send_success, ws_send_error, ws_safe_json_load, ws_yaml_
 
 GET_CONFIGURATION_SCHEMA = {
     vol.Required("type"): f"{WS_PREFIX}configuration/get",
+    vol.Optional("if_version"): str,
+    vol.Optional("sections"): [str],
+    vol.Optional("areas"): [str],
+    vol.Optional("domains"): [str],
+}
+
+SUBSCRIBE_CONFIGURATION_SCHEMA = {
+    vol.Required("type"): f"{WS_PREFIX}configuration/subscribe",
 }
 
 GET_VERSION_SCHEMA = {
@@ -44,6 +68,196 @@ async def get_areas_config(hass):
         }
 
     return result
+
+def _filter_keys(data: Mapping[str, Any], include: Callable[[str], bool] | None):
+    if include is None:
+        return data
+    return OrderedDict((key, value) for key, value in data.items() if include(key))
+
+def _domain_filter(domains: list[str] | None) -> Callable[[str], bool] | None:
+    """Match entity ids (light.kitchen) and domain keys (light) against domains."""
+    if domains is None:
+        return None
+    domains = set(domains)
+    return lambda key: key.split(".", 1)[0] in domains
+
+def _area_filter(areas: list[str] | None) -> Callable[[str], bool] | None:
+    if areas is None:
+        return None
+    return set(areas).__contains__
+
+# Options that configure the backend, not the homepage header
+HEADER_EXCLUDED_OPTIONS = (
+    "sidepanel_icon",
+    "sidepanel_title",
+    CONF_NOTIFICATIONS_MAX_COUNT,
+    CONF_NOTIFICATIONS_READ_TTL,
+)
+
+async def _load_homepage_header(hass, area_filter, domain_filter):
+    entries = hass.config_entries.async_entries(DOMAIN)
+    return (
+        {k: v for k, v in dict(entries[0].options).items()
+         if k not in HEADER_EXCLUDED_OPTIONS}
+        if entries else {}
+    )
+
+async def _load_more_pages(hass, area_filter, domain_filter):
+    # Served from the index kept current by process_yaml and the watcher
+    return OrderedDict(
+        (folder, copy.deepcopy(entry["config"]))
+        for folder, entry in get_more_pages_index().items()
+    )
+
+async def _load_entity_settings(hass, area_filter, domain_filter):
+    # Served from memory, see storage_helpers.StorageManager
+    return async_get_storage_manager(hass).async_get(domain_filter)
+
+async def _load_areas(hass, area_filter, domain_filter):
+    return _filter_keys(await get_areas_config(hass), area_filter)
+
+def _yaml_file_section(filename: str):
+    async def _load(hass, area_filter, domain_filter):
+        data = await async_load_yaml_file(hass, config_path(hass, filename))
+        return _filter_keys(data, domain_filter)
+    return _load
+
+def _card_dir_section(folder: str, by_area: bool = False, nested: bool = False):
+    async def _load(hass, area_filter, domain_filter):
+        return await async_load_yaml_from_dir(
+            hass,
+            config_path(hass, folder),
+            strip_ext=not nested,
+            nested=nested,
+            include=area_filter if by_area else domain_filter,
+        )
+    return _load
+
+# Section name -> loader(hass, area_filter, domain_filter)
+CONFIGURATION_SECTIONS: dict[str, Callable[..., Awaitable[Any]]] = {
+    "areas": _load_areas,
+    "entities": _yaml_file_section("entities.yaml"),
+    "entity_settings": _load_entity_settings,
+    "devices": _yaml_file_section("devices.yaml"),
+    "area_cards": _card_dir_section("cards/areas", by_area=True, nested=True),
+    "device_cards": _card_dir_section("cards/devices", nested=True),
+    "entity_cards": _card_dir_section("cards/entities"),
+    "devices_card": _card_dir_section("cards/devices_card"),
+    "entities_popup": _card_dir_section("cards/entities_popup"),
+    "devices_popup": _card_dir_section("cards/devices_popup"),
+    "homepage_header": _load_homepage_header,
+    "more_pages": _load_more_pages,
+}
+
+async def async_build_configuration(
+    hass: HomeAssistant,
+    sections: list[str] | None = None,
+    areas: list[str] | None = None,
+    domains: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Assemble the dashboard configuration payload.
+
+    - `sections`: only build these sections (default: all of them).
+    - `areas`: only include these area ids in `areas` and `area_cards`.
+    - `domains`: only include these domains in the entity and device
+      sections; entity keys are matched on their domain part.
+    """
+    area_filter = _area_filter(areas)
+    domain_filter = _domain_filter(domains)
+
+    # Sections are independent: load them side by side, a few at a time
+    semaphore = asyncio.Semaphore(CONFIGURATION_LOAD_CONCURRENCY)
+
+    async def _load_section(name):
+        async with semaphore:
+            return await CONFIGURATION_SECTIONS[name](hass, area_filter, domain_filter)
+
+    names = [name for name in CONFIGURATION_SECTIONS if sections is None or name in sections]
+    results = await asyncio.gather(*(_load_section(name) for name in names))
+
+    configuration = dict(zip(names, results))
+    configuration["installed_version"] = VERSION
+    return configuration
+
+class ConfigurationPublisher:
+    """
+    Push configuration changes to subscribed connections as JSON patches.
+
+    Keeps the last configuration sent to subscribers. When the configuration
+    version changes the payload is rebuilt (from the YAML cache) and only the
+    RFC 6902 operations between the two are sent, once per burst of changes.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._subscribers: dict[tuple[int, int], tuple[Any, int]] = {}
+        self._snapshot: dict[str, Any] | None = None
+        self._version: str | None = None
+        self._lock = asyncio.Lock()
+        self._unsub_updates: CALLBACK_TYPE | None = None
+        self._refresh_unsub: CALLBACK_TYPE | None = None
+
+    async def async_subscribe(self, connection, msg_id: int) -> tuple[str, dict[str, Any]]:
+        """Add a subscriber and return the version and configuration it starts from."""
+        async with self._lock:
+            if self._unsub_updates is None:
+                self._unsub_updates = self.hass.bus.async_listen(
+                    EVENT_CONFIGURATION_UPDATED, self._async_configuration_updated
+                )
+            if self._snapshot is None or self._version != async_get_config_version(self.hass):
+                await self._async_refresh_locked()
+            self._subscribers[(id(connection), msg_id)] = (connection, msg_id)
+            return self._version, self._snapshot
+
+    @callback
+    def async_unsubscribe(self, connection, msg_id: int) -> None:
+        """Remove a subscriber; stop tracking changes once nobody listens."""
+        self._subscribers.pop((id(connection), msg_id), None)
+        if self._subscribers:
+            return
+        for unsub in (self._unsub_updates, self._refresh_unsub):
+            if unsub:
+                unsub()
+        self._unsub_updates = self._refresh_unsub = None
+        self._snapshot = self._version = None
+
+    @callback
+    def _async_configuration_updated(self, event) -> None:
+        if self._refresh_unsub is None:
+            self._refresh_unsub = async_call_later(
+                self.hass, CONFIGURATION_PUSH_DELAY, self._async_refresh
+            )
+
+    async def _async_refresh(self, _now=None) -> None:
+        self._refresh_unsub = None
+        async with self._lock:
+            if self._subscribers and self._version != async_get_config_version(self.hass):
+                await self._async_refresh_locked()
+
+    async def _async_refresh_locked(self) -> None:
+        version = async_get_config_version(self.hass)
+        configuration = await async_build_configuration(self.hass)
+
+        if self._snapshot is not None:
+            patch = make_json_patch(self._snapshot, configuration)
+            if patch:
+                for connection, msg_id in list(self._subscribers.values()):
+                    connection.send_message(
+                        websocket_api.event_message(msg_id, {"version": version, "patch": patch})
+                    )
+
+        self._snapshot = configuration
+        self._version = version
+
+@callback
+def async_get_configuration_publisher(hass: HomeAssistant) -> ConfigurationPublisher:
+    """Return the shared configuration publisher."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_CONFIGURATION_PUBLISHER not in domain_data:
+        domain_data[DATA_CONFIGURATION_PUBLISHER] = ConfigurationPublisher(hass)
+    return domain_data[DATA_CONFIGURATION_PUBLISHER]
+
 # ------------------------------------------------------------------
 # Commands
 # ------------------------------------------------------------------
@@ -55,47 +269,65 @@ async def ws_get_configuration(
     connection,
     msg: Mapping[str, Any],
 ) -> None:
-    """Return full dashboard configuration."""
+    """
+    Return full dashboard configuration.
+
+    Clients may pass the `version` of the copy they hold as `if_version`;
+    if nothing changed since, only {"unchanged": True, "version": ...} is sent.
+    `sections`, `areas` and `domains` narrow the payload so card trees can be
+    fetched lazily when a page opens.
+    """
     try:
-        entries = hass.config_entries.async_entries(DOMAIN)
-        homepage_header = (
-            {k: v for k, v in dict(entries[0].options).items()
-             if k not in ("sidepanel_icon", "sidepanel_title")}
-            if entries else {}
-        )
+        # Read the version first so a change during assembly causes a refetch
+        version = async_get_config_version(hass)
+        if msg.get("if_version") == version:
+            connection.send_result(msg["id"], {"unchanged": True, "version": version})
+            return
+
+        unknown = set(msg.get("sections", [])) - CONFIGURATION_SECTIONS.keys()
+        if unknown:
+            ws_send_error(connection, msg["id"], "invalid_format", f"Unknown sections: {', '.join(sorted(unknown))}")
+            return
 
-        more_pages = OrderedDict()
-        more_pages_dir = config_path(hass, "more_pages")
-
-        if os.path.isdir(more_pages_dir):
-            dirs = await hass.async_add_executor_job(os.listdir, more_pages_dir)
-            for folder in dirs:
-                cfg = os.path.join(more_pages_dir, folder, "config.yaml")
-                page = os.path.join(more_pages_dir, folder, "page.yaml")
-                if os.path.exists(cfg) and os.path.exists(page):
-                    more_pages[folder] = await async_load_yaml_file(hass, cfg)
-
-        connection.send_result(
-            msg["id"],
-            {
-                "areas": await get_areas_config(hass),
-                "entities": await async_load_yaml_file(hass, config_path(hass, "entities.yaml")),
-                "devices": await async_load_yaml_file(hass, config_path(hass, "devices.yaml")),
-                "area_cards": await async_load_yaml_from_dir(hass, config_path(hass, "cards/areas"), nested=True),
-                "device_cards": await async_load_yaml_from_dir(hass, config_path(hass, "cards/devices"), nested=True),
-                "entity_cards": await async_load_yaml_from_dir(hass, config_path(hass, "cards/entities"), strip_ext=True),
-                "devices_card": await async_load_yaml_from_dir(hass, config_path(hass, "cards/devices_card"), strip_ext=True),
-                "entities_popup": await async_load_yaml_from_dir(hass, config_path(hass, "cards/entities_popup"), strip_ext=True),
-                "devices_popup": await async_load_yaml_from_dir(hass, config_path(hass, "cards/devices_popup"), strip_ext=True),
-                "homepage_header": homepage_header,
-                "more_pages": more_pages,
-                "installed_version": VERSION,
-            },
+        configuration = await async_build_configuration(
+            hass,
+            sections=msg.get("sections"),
+            areas=msg.get("areas"),
+            domains=msg.get("domains"),
         )
+        configuration["version"] = version
+        connection.send_result(msg["id"], configuration)
     except Exception as err:
         ws_send_error(connection, msg["id"], "load_error", f"Failed to get configuration: {err}")
 
 
+@websocket_api.async_response
+@websocket_api.websocket_command(SUBSCRIBE_CONFIGURATION_SCHEMA)
+async def ws_subscribe_configuration(
+    hass: HomeAssistant,
+    connection,
+    msg: Mapping[str, Any],
+) -> None:
+    """
+    Subscribe to the dashboard configuration.
+
+    The first event carries {"version", "configuration"}; every later event
+    carries {"version", "patch"} with RFC 6902 operations to apply to it.
+    """
+    publisher = async_get_configuration_publisher(hass)
+    try:
+        version, configuration = await publisher.async_subscribe(connection, msg["id"])
+    except Exception as err:
+        ws_send_error(connection, msg["id"], "load_error", f"Failed to get configuration: {err}")
+        return
+
+    connection.subscriptions[msg["id"]] = partial(publisher.async_unsubscribe, connection, msg["id"])
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"version": version, "configuration": configuration})
+    )
+
+
 @websocket_api.async_response
 @websocket_api.websocket_command(GET_VERSION_SCHEMA)
 async def ws_get_version(
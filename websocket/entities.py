@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN, WS_PREFIX, RELOAD_HOME, RELOAD_DEVICES
 from ..utils import config_path, async_save_yaml
-from .helpers import ws_send_success, ws_send_error, handle_ws_yaml_update
+from .helpers import ws_send_success, ws_send_error, handle_ws_yaml_update, handle_ws_yaml_transaction
 from .storage_helpers import async_handle_ws_storage_update
 
 _LOGGER = logging.getLogger(__name__)
@@ -81,23 +81,20 @@ async def ws_edit_entity_card(hass, connection, msg):
 
     card_file = config_path(hass, "cards/entities", f"{entity_id}.yaml")
 
-    # Always overwrite existing file
-    await handle_ws_yaml_update(
-        hass, connection, msg, card_file,
-        updates=card_data,
-        reload_events=[RELOAD_HOME, RELOAD_DEVICES],
-        success_msg="Card updated successfully"
-    )
-
     # Make sure the entity YAML marks it as custom_card
     def update_entities(data):
         data.setdefault(entity_id, OrderedDict())["custom_card"] = True
         return data
 
-    await handle_ws_yaml_update(
-        hass, connection, msg, config_path(hass, "entities.yaml"),
-        updates=update_entities,
-        reload_events=[RELOAD_HOME, RELOAD_DEVICES]
+    # Update the card file and entities.yaml in one transaction
+    await handle_ws_yaml_transaction(
+        hass, connection, msg,
+        {
+            card_file: card_data,
+            config_path(hass, "entities.yaml"): update_entities,
+        },
+        reload_events=[RELOAD_HOME, RELOAD_DEVICES],
+        success_msg="Card updated successfully"
     )
 
 # -----------------------------
@@ -122,22 +119,19 @@ async def ws_edit_entity_popup(hass: HomeAssistant, connection, msg: Mapping[str
 
     popup_file = config_path(hass, "cards/entities_popup", f"{entity_id}.yaml")
 
-    await handle_ws_yaml_update(
-        hass, connection, msg, popup_file,
-        updates=popup_data,
-        reload_events = [f"{DOMAIN}_reload"],
-        success_msg="Entity popup saved successfully"
-    )
-
     # Enable custom popup flag in entities.yaml
     def update_entities(data):
         data.setdefault(entity_id, OrderedDict())["custom_popup"] = True
         return data
 
-    await handle_ws_yaml_update(
-        hass, connection, msg, config_path(hass, "entities.yaml"),
-        updates=update_entities,
-        reload_events = [f"{DOMAIN}_reload"]
+    await handle_ws_yaml_transaction(
+        hass, connection, msg,
+        {
+            popup_file: popup_data,
+            config_path(hass, "entities.yaml"): update_entities,
+        },
+        reload_events = [f"{DOMAIN}_reload"],
+        success_msg="Entity popup saved successfully"
     )
 
 # -----------------------------
@@ -10,7 +10,12 @@ from typing import Any, Mapping, Callable
 
 from homeassistant.core import HomeAssistant
 
-from ..utils import async_load_yaml, async_save_yaml, handle_ws_yaml_update
+from ..const import SORT_SAVE_DELAY
+from ..utils import (
+    YamlTransaction,
+    handle_ws_yaml_transaction,
+    handle_ws_yaml_update,
+)
 
 def ws_send_success(connection, msg_id: int, message: str = "Success") -> None:
     """Send standardized success response."""
@@ -43,6 +48,39 @@ def ws_safe_json_load(
         return None
 
 
+# ------------------------------------------------------------------
+# JSON patch
+# ------------------------------------------------------------------
+
+def _json_pointer_token(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+def make_json_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Return RFC 6902 operations that turn `old` into `new`.
+
+    Mappings are diffed key by key; lists and scalars that differ are
+    replaced as a whole.
+    """
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        ops = [
+            {"op": "remove", "path": f"{path}/{_json_pointer_token(key)}"}
+            for key in old
+            if key not in new
+        ]
+        for key, value in new.items():
+            child = f"{path}/{_json_pointer_token(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(make_json_patch(old[key], value, child))
+        return ops
+
+    if old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
 # ------------------------------------------------------------------
 # Generic YAML Sorting
 # ------------------------------------------------------------------
@@ -64,12 +102,11 @@ async def ws_sort_yaml(
     if order is None:
         return
 
-    yaml_data = await async_load_yaml(hass, yaml_file) or {}
-
-    for index, item_id in enumerate(order, start=1):
-        yaml_data.setdefault(item_id, OrderedDict())[sort_key] = index
+    # Drag-and-drop sends a burst of sort events, coalesce them into one write
+    async with YamlTransaction(hass, yaml_file, delay=SORT_SAVE_DELAY) as tx:
+        for index, item_id in enumerate(order, start=1):
+            tx[yaml_file].setdefault(item_id, OrderedDict())[sort_key] = index
 
-    await async_save_yaml(hass, yaml_file, yaml_data)
     ws_send_success(connection, msg["id"], "Sorted successfully")
 
 
@@ -14,9 +14,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.components import websocket_api
 from homeassistant.util import slugify
 
-from ..const import DOMAIN, WS_PREFIX, RELOAD_HOME, RELOAD_DEVICES
+from ..const import WS_PREFIX, RELOAD_HOME, RELOAD_DEVICES, RELOAD_DASHBOARD, RELOAD_MORE_PAGES, RELOAD_NAVIGATION
 from ..utils import config_path, async_remove_file_or_folder, async_save_yaml
-from ..process_yaml import reload_configuration
+from ..process_yaml import async_refresh_more_page
 from .helpers import ws_send_success, ws_send_error, ws_safe_json_load, ws_yaml_edit_command
 
 EDIT_MORE_PAGE_SCHEMA = {
@@ -76,11 +76,10 @@ def ws_edit_more_page_factory():
             },
         )
 
-        # Reload events
-        #hass.bus.async_fire("{{ DOMAIN }}.reload")
-        await hass.services.async_call(DOMAIN, "reload")
-        hass.bus.async_fire(f"{DOMAIN}.navigation_card_reload")
-        await reload_configuration(hass)
+        # Refresh only this page, then reload events
+        await async_refresh_more_page(hass, folder)
+        hass.bus.async_fire(RELOAD_MORE_PAGES)
+        hass.bus.async_fire(RELOAD_NAVIGATION)
 
         ws_send_success(connection, msg["id"], "More page saved")
 
@@ -109,10 +108,10 @@ async def ws_remove_more_page(
             hass,
             config_path(hass, "more_pages", msg["foldername"]),
         )
+        await async_refresh_more_page(hass, msg["foldername"])
 
-        hass.bus.async_fire(RELOAD_EVENT)
-        hass.bus.async_fire(RELOAD_NAV_EVENT)
-        await reload_configuration(hass)
+        hass.bus.async_fire(RELOAD_DASHBOARD)
+        hass.bus.async_fire(RELOAD_NAVIGATION)
 
         ws_send_success(connection, msg["id"], "More page removed")
     except Exception as err:
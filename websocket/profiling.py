@@ -0,0 +1,43 @@
+"""
+WebSocket commands for Dashboard template profiling.
+"""
+
+import logging
+from typing import Any, Mapping
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.components import websocket_api
+
+from ..const import WS_PREFIX
+from ..process_yaml import get_template_profile, reset_template_profile, template_memo_stats
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_SORT_KEYS = ["self_time", "render_time", "parse_time", "calls", "memo_hits", "output_size"]
+
+# ------------------------------------------------------------------
+# Get per-template render statistics
+# ------------------------------------------------------------------
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{WS_PREFIX}profile/templates",
+    vol.Optional("sort", default="self_time"): vol.In(PROFILE_SORT_KEYS),
+    vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    vol.Optional("reset", default=False): bool,
+})
+def ws_profile_templates(hass: HomeAssistant, connection, msg: Mapping[str, Any]):
+    """
+    Return render time, parse time, output size and call counts per file.
+
+    Times are in seconds and exclude the files a template includes.
+    With `reset`, the counters start over after this response.
+    """
+    templates = get_template_profile(msg["sort"], msg.get("limit"))
+    connection.send_result(msg["id"], {
+        "templates": templates,
+        "memo": dict(template_memo_stats),
+    })
+    if msg["reset"]:
+        reset_template_profile()
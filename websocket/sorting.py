@@ -9,7 +9,7 @@ from homeassistant.components import websocket_api
 
 from ..const import WS_PREFIX
 from ..utils import config_path
-from .helpers import ws_send_success, ws_send_error, ws_safe_json_load, ws_yaml_edit_command
+from .helpers import ws_send_success, ws_send_error, ws_safe_json_load, ws_sort_yaml, ws_yaml_edit_command
 
 SORT_AREA_SCHEMA = {
     vol.Required("type"): f"{WS_PREFIX}sort_area_button",
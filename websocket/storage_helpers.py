@@ -1,43 +1,51 @@
 from collections import OrderedDict
 from typing import Any, Mapping, Callable, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-from ..const import DOMAIN
+from ..const import DOMAIN, DATA_STORAGE, STORAGE_SAVE_DELAY
+from ..utils import async_bump_config_version
 from .helpers import ws_send_success, ws_send_error
 
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_entities"
 
 
-async def async_handle_ws_storage_update(
-    hass: HomeAssistant,
-    connection,
-    msg: Mapping[str, Any],
-    *,
-    updates: Any = None,
-    key: Optional[str] = None,
-    reload_events: Optional[list[str]] = None,
-    success_msg: Optional[str] = None,
-):
-    """Storage-based replacement for handle_ws_yaml_update."""
+class StorageManager:
+    """
+    Entity settings (flags, sort orders) held in memory for the whole run.
 
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    The document is loaded once at setup; updates are applied in place and
+    written with a delayed save, so a burst of toggles costs one write.
+    """
 
-    data = await store.async_load()
-    if data is None:
-        data = OrderedDict()
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.data: OrderedDict[str, Any] = OrderedDict()
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
 
-    # --------------------------------
-    # Apply updates
-    # --------------------------------
-    try:
+    async def async_load(self):
+        data = await self._store.async_load()
+        if data:
+            self.data.update(data)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        # A copy: the write runs in the executor while updates keep coming in
+        return self.async_get()
+
+    @callback
+    def async_update(self, updates: Any = None, key: Optional[str] = None) -> OrderedDict[str, Any]:
+        """Apply updates in place and schedule a save."""
         if callable(updates):
-            data = updates(data)
+            data = updates(self.data)
+            if data is not self.data:
+                self.data.clear()
+                self.data.update(data)
 
         elif key:
-            entity_data = data.setdefault(key, OrderedDict())
+            entity_data = self.data.setdefault(key, OrderedDict())
             if isinstance(updates, dict):
                 for k, v in updates.items():
                     if v is not None:
@@ -46,15 +54,60 @@ async def async_handle_ws_storage_update(
         elif isinstance(updates, dict):
             for k, v in updates.items():
                 if v is not None:
-                    data[k] = v
+                    self.data[k] = v
 
-    except Exception as err:
-        return ws_send_error(connection, msg, "storage_update_failed", str(err))
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+        return self.data
+
+    @callback
+    def async_get(self, include: Optional[Callable[[str], bool]] = None) -> dict[str, Any]:
+        """Return a copy of the settings of the entities matching include (all by default)."""
+        return {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in self.data.items()
+            if include is None or include(key)
+        }
+
+
+async def async_setup_storage(hass: HomeAssistant) -> StorageManager:
+    """Load the entity settings once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_STORAGE not in domain_data:
+        manager = StorageManager(hass)
+        await manager.async_load()
+        domain_data[DATA_STORAGE] = manager
+    return domain_data[DATA_STORAGE]
+
+
+@callback
+def async_get_storage_manager(hass: HomeAssistant) -> StorageManager:
+    """Return the entity settings manager set up by async_setup_storage."""
+    return hass.data[DOMAIN][DATA_STORAGE]
+
+
+async def async_handle_ws_storage_update(
+    hass: HomeAssistant,
+    connection,
+    msg: Mapping[str, Any],
+    *,
+    updates: Any = None,
+    key: Optional[str] = None,
+    reload_events: Optional[list[str]] = None,
+    success_msg: Optional[str] = None,
+):
+    """Storage-based replacement for handle_ws_yaml_update."""
+
+    manager = await async_setup_storage(hass)
 
     # --------------------------------
-    # Save to .storage
+    # Apply updates (saved to .storage after STORAGE_SAVE_DELAY)
     # --------------------------------
-    await store.async_save(data)
+    try:
+        data = manager.async_update(updates, key)
+    except Exception as err:
+        return ws_send_error(connection, msg["id"], "storage_update_failed", str(err))
+
+    async_bump_config_version(hass)
 
     # --------------------------------
     # Fire reload events
@@ -64,6 +117,6 @@ async def async_handle_ws_storage_update(
             hass.bus.async_fire(event)
 
     if success_msg:
-        ws_send_success(connection, msg, success_msg)
+        ws_send_success(connection, msg["id"], success_msg)
 
     return data
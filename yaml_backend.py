@@ -0,0 +1,115 @@
+"""
+YAML parser backend for Dashboard.
+
+Plain config files are parsed and dumped with the libyaml C loader/dumper
+when PyYAML was built against libyaml, and with the pure-Python
+implementations otherwise. Run this module directly to compare the
+backends on a card directory:
+
+    python yaml_backend.py /config/dwains-dashboard/configs/cards
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections import OrderedDict
+
+import yaml
+from yaml.representer import SafeRepresenter
+
+try:
+    from yaml import CSafeLoader as FastSafeLoader, CSafeDumper as FastSafeDumper
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as FastSafeLoader, SafeDumper as FastSafeDumper
+    HAS_LIBYAML = False
+
+
+class DashboardSafeDumper(FastSafeDumper):
+    """Fastest available safe dumper that writes OrderedDicts as plain mappings."""
+
+
+DashboardSafeDumper.add_representer(OrderedDict, SafeRepresenter.represent_dict)
+
+
+def parse_yaml(content: str):
+    """
+    Parse YAML text with the fastest available loader.
+
+    The pure-Python loader is retried on errors: it uses the patched
+    composer from process_yaml, which accepts redefined anchors.
+    """
+    if HAS_LIBYAML:
+        try:
+            return yaml.load(content, Loader=FastSafeLoader)
+        except yaml.YAMLError:
+            pass
+    return yaml.load(content, Loader=yaml.SafeLoader)
+
+
+def dump_yaml(data) -> str:
+    """Dump data to YAML text, keeping key order."""
+    try:
+        return yaml.dump(data, Dumper=DashboardSafeDumper, default_flow_style=False, sort_keys=False)
+    except yaml.representer.RepresenterError:
+        # Not a plain JSON-like document, use the full dumper
+        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+
+
+def load_yaml_file(filepath: str):
+    """Read and parse a YAML file (blocking)."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        return parse_yaml(f.read())
+
+
+# ------------------------------------------------------------------
+# Micro-benchmark
+# ------------------------------------------------------------------
+
+def benchmark_backends(paths: list[str], rounds: int = 5) -> dict[str, dict[str, float]]:
+    """
+    Time the C and pure-Python backends on the given YAML files.
+
+    Returns the best-of-`rounds` load and dump time in seconds per backend.
+    """
+    contents = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            contents.append(f.read())
+
+    backends = {"python": (yaml.SafeLoader, yaml.SafeDumper)}
+    if HAS_LIBYAML:
+        backends["libyaml"] = (yaml.CSafeLoader, yaml.CSafeDumper)
+
+    results = {}
+    for name, (loader_cls, dumper_cls) in backends.items():
+        load_times = []
+        dump_times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            docs = [yaml.load(content, Loader=loader_cls) for content in contents]
+            load_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for doc in docs:
+                yaml.dump(doc, Dumper=dumper_cls, default_flow_style=False, sort_keys=False)
+            dump_times.append(time.perf_counter() - start)
+        results[name] = {"load": min(load_times), "dump": min(dump_times)}
+    return results
+
+
+def _find_yaml_files(directories: list[str]) -> list[str]:
+    files = []
+    for directory in directories:
+        for root, _dirs, fnames in os.walk(directory):
+            files.extend(os.path.join(root, f) for f in sorted(fnames) if f.endswith(".yaml"))
+    return files
+
+
+if __name__ == "__main__":
+    files = _find_yaml_files(sys.argv[1:] or ["."])
+    print(f"{len(files)} YAML files, libyaml available: {HAS_LIBYAML}")
+    for backend, timings in benchmark_backends(files).items():
+        print(f"{backend:>8}: load {timings['load'] * 1000:8.2f} ms  dump {timings['dump'] * 1000:8.2f} ms")